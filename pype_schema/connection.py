@@ -36,11 +36,11 @@ class Connection(ABC):
         Default is None, indicating the destination does not have any children
     """
 
-    id: str = NotImplemented
-    contents: utils.ContentsType = NotImplemented
-    source: node.Node = NotImplemented
-    destination: node.Node = NotImplemented
-    tags: dict = NotImplemented
+    id: str
+    contents: utils.ContentsType
+    source: node.Node
+    destination: node.Node
+    tags: dict
     bidirectional: bool = False
     exit_point: node.Node = None
     entry_point: node.Node = None
@@ -357,7 +357,7 @@ class Pipe(Connection):
         design_pres=None,
         lower_heating_value=None,
         higher_heating_value=None,
-        tags={},
+        tags=None,
         bidirectional=False,
         exit_point=None,
         entry_point=None,
@@ -375,7 +375,7 @@ class Pipe(Connection):
         self.max_flow = max_flow
         self.design_flow = design_flow
         self.set_heating_values(lower_heating_value, higher_heating_value)
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.bidirectional = bidirectional
         self.exit_point = exit_point
         self.entry_point = entry_point
@@ -505,7 +505,7 @@ class Pipe(Connection):
             + "`min_flow`, `max_flow` and `design_flow` attributes",
             DeprecationWarning,
         )
-        self.flow_rate = (min, max, design)
+        self.flow_rate = utils.MinMaxDesign(min, max, design)
         self._min_flow = min
         self._max_flow = max
         self._design_flow = design
@@ -526,7 +526,9 @@ class Pipe(Connection):
     def del_min_flow(self):
         del self._min_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (None, self.flow_rate[1], self.flow_rate[2])
+            self.flow_rate = utils.MinMaxDesign(
+                None, self.flow_rate[1], self.flow_rate[2]
+            )
 
     def get_max_flow(self):
         try:
@@ -544,7 +546,9 @@ class Pipe(Connection):
     def del_max_flow(self):
         del self._max_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (self.flow_rate[0], None, self.flow_rate[2])
+            self.flow_rate = utils.MinMaxDesign(
+                self.flow_rate[0], None, self.flow_rate[2]
+            )
 
     def get_design_flow(self):
         try:
@@ -562,7 +566,9 @@ class Pipe(Connection):
     def del_design_flow(self):
         del self._design_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (self.flow_rate[0], self.flow_rate[1], None)
+            self.flow_rate = utils.MinMaxDesign(
+                self.flow_rate[0], self.flow_rate[1], None
+            )
 
     min_flow = property(get_min_flow, set_min_flow, del_min_flow)
     max_flow = property(get_max_flow, set_max_flow, del_max_flow)
@@ -587,7 +593,7 @@ class Pipe(Connection):
             + "`min_pressure`, `max_pressure` and `design_pressure` attributes",
             DeprecationWarning,
         )
-        self.pressure = (min, max, design)
+        self.pressure = utils.MinMaxDesign(min, max, design)
         self._min_pressure = min
         self._max_pressure = max
         self._design_pressure = design
@@ -608,7 +614,7 @@ class Pipe(Connection):
     def del_min_pressure(self):
         del self._min_pressure
         if hasattr(self, "pressure"):
-            self.pressure = (None, self.pressure[1], self.pressure[2])
+            self.pressure = utils.MinMaxDesign(None, self.pressure[1], self.pressure[2])
 
     def get_max_pressure(self):
         try:
@@ -626,7 +632,7 @@ class Pipe(Connection):
     def del_max_pressure(self):
         del self._max_pressure
         if hasattr(self, "pressure"):
-            self.pressure = (self.pressure[0], None, self.pressure[2])
+            self.pressure = utils.MinMaxDesign(self.pressure[0], None, self.pressure[2])
 
     def get_design_pressure(self):
         try:
@@ -645,7 +651,7 @@ class Pipe(Connection):
     def del_design_pressure(self):
         del self._design_pressure
         if hasattr(self, "pressure"):
-            self.pressure = (self.pressure[0], self.pressure[1], None)
+            self.pressure = utils.MinMaxDesign(self.pressure[0], self.pressure[1], None)
 
     min_pressure = property(get_min_pressure, set_min_pressure, del_min_pressure)
     max_pressure = property(get_max_pressure, set_max_pressure, del_max_pressure)
@@ -733,7 +739,7 @@ class Wire(Connection):
         contents,
         source,
         destination,
-        tags={},
+        tags=None,
         bidirectional=False,
         exit_point=None,
         entry_point=None,
@@ -742,7 +748,7 @@ class Wire(Connection):
         self.contents = contents
         self.source = source
         self.destination = destination
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.bidirectional = bidirectional
         self.exit_point = exit_point
         self.entry_point = entry_point
@@ -887,7 +893,7 @@ class Wireless(Connection):
         contents,
         source,
         destination,
-        tags={},
+        tags=None,
         bidirectional=False,
         exit_point=None,
         entry_point=None,
@@ -896,7 +902,7 @@ class Wireless(Connection):
         self.contents = contents
         self.source = source
         self.destination = destination
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.bidirectional = bidirectional
         self.exit_point = exit_point
         self.entry_point = entry_point
@@ -1050,7 +1056,7 @@ class Delivery(Connection):
         contents,
         source,
         destination,
-        tags={},
+        tags=None,
         bidirectional=False,
         exit_point=None,
         entry_point=None,
@@ -1059,7 +1065,7 @@ class Delivery(Connection):
         self.contents = contents
         self.source = source
         self.destination = destination
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.bidirectional = bidirectional
         self.exit_point = exit_point
         self.entry_point = entry_point
@@ -39,10 +39,10 @@ class Node(ABC):
         Data tags associated with this node
     """
 
-    id: str = NotImplemented
-    input_contents: list[utils.ContentsType] = NotImplemented
-    output_contents: list[utils.ContentsType] = NotImplemented
-    tags: dict = NotImplemented
+    id: str
+    input_contents: list[utils.ContentsType]
+    output_contents: list[utils.ContentsType]
+    tags: dict
 
     def __repr__(self):
         return (
@@ -102,7 +102,7 @@ class Node(ABC):
             + "`min_flow`, `max_flow` and `design_flow` attributes",
             DeprecationWarning,
         )
-        self.flow_rate = (min, max, design)
+        self.flow_rate = utils.MinMaxDesign(min, max, design)
         self._min_flow = min
         self._max_flow = max
         self._design_flow = design
@@ -123,7 +123,9 @@ class Node(ABC):
     def del_min_flow(self):
         del self._min_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (None, self.flow_rate[1], self.flow_rate[2])
+            self.flow_rate = utils.MinMaxDesign(
+                None, self.flow_rate[1], self.flow_rate[2]
+            )
 
     def get_max_flow(self):
         try:
@@ -141,7 +143,9 @@ class Node(ABC):
     def del_max_flow(self):
         del self._max_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (self.flow_rate[0], None, self.flow_rate[2])
+            self.flow_rate = utils.MinMaxDesign(
+                self.flow_rate[0], None, self.flow_rate[2]
+            )
 
     def get_design_flow(self):
         try:
@@ -159,7 +163,9 @@ class Node(ABC):
     def del_design_flow(self):
         del self._design_flow
         if hasattr(self, "flow_rate"):
-            self.flow_rate = (self.flow_rate[0], self.flow_rate[1], None)
+            self.flow_rate = utils.MinMaxDesign(
+                self.flow_rate[0], self.flow_rate[1], None
+            )
 
     min_flow = property(get_min_flow, set_min_flow, del_min_flow)
     max_flow = property(get_max_flow, set_max_flow, del_max_flow)
@@ -301,13 +307,15 @@ class Node(ABC):
 
         if hasattr(self, "connections"):
             for connection in self.connections.values():
-                tags = tags + list(connection.tags.values())
+                tags.extend(connection.tags.values())
 
         if hasattr(self, "nodes"):
             for node in self.nodes.values():
-                tags = tags + list(node.tags.values())
                 if recurse:
-                    tags = tags + node.get_all_tags(recurse=recurse)
+                    # the recursive call already includes the node's own tags
+                    tags.extend(node.get_all_tags(recurse=recurse))
+                else:
+                    tags.extend(node.tags.values())
 
         # remove duplicates from grabbing top level and next level
         tags = list(set(tags))
@@ -1068,17 +1076,17 @@ class Network(Node):
         id,
         input_contents,
         output_contents,
-        tags={},
-        nodes={},
-        connections={},
+        tags=None,
+        nodes=None,
+        connections=None,
         num_units=1,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
-        self.tags = tags
-        self.nodes = nodes
-        self.connections = connections
+        self.tags = {} if tags is None else tags
+        self.nodes = {} if nodes is None else nodes
+        self.connections = {} if connections is None else connections
         self.num_units = num_units
 
     def __repr__(self):
@@ -1290,9 +1298,9 @@ class Facility(Network):
         min_flow,
         max_flow,
         design_flow,
-        tags={},
-        nodes={},
-        connections={},
+        tags=None,
+        nodes=None,
+        connections=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -1301,9 +1309,9 @@ class Facility(Network):
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
-        self.nodes = nodes
-        self.connections = connections
-        self.tags = tags
+        self.nodes = {} if nodes is None else nodes
+        self.connections = {} if connections is None else connections
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -1358,12 +1366,12 @@ class Joint(Node):
         id,
         input_contents,
         output_contents,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -1441,16 +1449,16 @@ class ModularUnit(Network):
         input_contents,
         output_contents,
         num_units,
-        tags={},
-        nodes={},
-        connections={},
+        tags=None,
+        nodes=None,
+        connections=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
-        self.tags = tags
-        self.nodes = nodes
-        self.connections = connections
+        self.tags = {} if tags is None else tags
+        self.nodes = {} if nodes is None else nodes
+        self.connections = {} if connections is None else connections
         self.num_units = num_units
 
     def __repr__(self):
@@ -1574,7 +1582,7 @@ class Pump(Node):
         num_units,
         pump_type=utils.PumpType.Constant,
         efficiency=None,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -1584,7 +1592,7 @@ class Pump(Node):
         self.power_rating = power_rating
         self.num_units = num_units
         self.efficiency = efficiency
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -1734,7 +1742,7 @@ class Tank(Node):
         elevation,
         volume,
         num_units=1,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -1742,7 +1750,7 @@ class Tank(Node):
         self.elevation = elevation
         self.volume = volume
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -1884,7 +1892,7 @@ class Reactor(Node):
         residence_time,
         dosing_rate={},
         pH=None,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -1897,7 +1905,7 @@ class Reactor(Node):
         self.set_dosing_rate(dosing_rate)
         self.pH = pH
         self.residence_time = residence_time
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -2033,7 +2041,7 @@ class StaticMixer(Reactor):
         residence_time,
         dosing_rate={},
         pH=None,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -2046,7 +2054,7 @@ class StaticMixer(Reactor):
         self.set_dosing_rate(dosing_rate)
         self.pH = pH
         self.residence_time = residence_time
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -2128,14 +2136,14 @@ class Reservoir(Node):
         output_contents,
         elevation,
         volume,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.elevation = elevation
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -2222,7 +2230,7 @@ class Battery(Node):
         discharge_rate,
         rte,
         leakage,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.input_contents = [utils.ContentsType.Electricity]
@@ -2232,7 +2240,7 @@ class Battery(Node):
         self.discharge_rate = discharge_rate
         self.rte = rte
         self.leakage = leakage
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -2410,7 +2418,7 @@ class Digestion(Node):
         num_units,
         volume,
         digester_type,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -2418,7 +2426,7 @@ class Digestion(Node):
         self.num_units = num_units
         self.volume = volume
         self.digester_type = digester_type
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -2516,13 +2524,13 @@ class Cogeneration(Node):
     """
 
     def __init__(
-        self, id, input_contents, min_gen, max_gen, design_gen, num_units, tags={}
+        self, id, input_contents, min_gen, max_gen, design_gen, num_units, tags=None
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.output_contents = [utils.ContentsType.Electricity, utils.ContentsType.Heat]
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_gen = min_gen
         self.max_gen = max_gen
         self.design_gen = design_gen
@@ -2573,7 +2581,7 @@ class Cogeneration(Node):
             + "`min_gen`, `max_gen` and `design_gen` attributes",
             DeprecationWarning,
         )
-        self.gen_capacity = (min, max, design)
+        self.gen_capacity = utils.MinMaxDesign(min, max, design)
         self._min_gen = min
         self._max_gen = max
         self._design_gen = design
@@ -2594,7 +2602,9 @@ class Cogeneration(Node):
     def del_min_gen(self):
         del self._min_gen
         if hasattr(self, "gen_capacity"):
-            self.gen_capacity = (None, self.gen_capacity[1], self.gen_capacity[2])
+            self.gen_capacity = utils.MinMaxDesign(
+                None, self.gen_capacity[1], self.gen_capacity[2]
+            )
 
     def get_max_gen(self):
         try:
@@ -2612,7 +2622,9 @@ class Cogeneration(Node):
     def del_max_gen(self):
         del self._max_gen
         if hasattr(self, "gen_capacity"):
-            self.gen_capacity = (self.gen_capacity[0], None, self.gen_capacity[2])
+            self.gen_capacity = utils.MinMaxDesign(
+                self.gen_capacity[0], None, self.gen_capacity[2]
+            )
 
     def get_design_gen(self):
         try:
@@ -2630,7 +2642,9 @@ class Cogeneration(Node):
     def del_design_gen(self):
         del self._design_gen
         if hasattr(self, "gen_capacity"):
-            self.gen_capacity = (self.gen_capacity[0], self.gen_capacity[1], None)
+            self.gen_capacity = utils.MinMaxDesign(
+                self.gen_capacity[0], self.gen_capacity[1], None
+            )
 
     min_gen = property(get_min_gen, set_min_gen, del_min_gen)
     max_gen = property(get_max_gen, set_max_gen, del_max_gen)
@@ -2719,13 +2733,13 @@ class Boiler(Node):
     """
 
     def __init__(
-        self, id, input_contents, min_gen, max_gen, design_gen, num_units, tags={}
+        self, id, input_contents, min_gen, max_gen, design_gen, num_units, tags=None
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.output_contents = [utils.ContentsType.Heat]
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_gen = min_gen
         self.max_gen = max_gen
         self.design_gen = design_gen
@@ -2775,7 +2789,7 @@ class Boiler(Node):
             + "`min_gen`, `max_gen` and `design_gen` attributes",
             DeprecationWarning,
         )
-        self.gen_capacity = (min, max, design)
+        self.gen_capacity = utils.MinMaxDesign(min, max, design)
 
     def get_min_gen(self):
         try:
@@ -2920,14 +2934,14 @@ class Clarification(Node):
         design_flow,
         num_units,
         volume,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3046,14 +3060,14 @@ class Filtration(Node):
         volume,
         dosing_rate={},
         settling_time=0.0,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3212,14 +3226,14 @@ class ROMembrane(Filtration):
         selectivity,
         dosing_rate={},
         settling_time=0.0,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3330,13 +3344,13 @@ class Screening(Node):
         max_flow,
         design_flow,
         num_units,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3435,13 +3449,13 @@ class Conditioning(Node):
         max_flow,
         design_flow,
         num_units,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3546,14 +3560,14 @@ class Thickening(Node):
         design_flow,
         num_units,
         volume,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3658,14 +3672,14 @@ class Aeration(Node):
         design_flow,
         num_units,
         volume,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3785,14 +3799,14 @@ class Disinfection(Node):
         volume,
         dosing_rate={},
         residence_time=None,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -3947,14 +3961,14 @@ class Chlorination(Disinfection):
         volume,
         dosing_rate={},
         residence_time=None,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
         self.set_contents(output_contents, "output_contents")
         self.num_units = num_units
         self.volume = volume
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -4054,7 +4068,7 @@ class UVSystem(Disinfection):
         residence_time,
         intensity,
         area,
-        tags={},
+        tags=None,
     ):
         self.id = id
         self.set_contents(input_contents, "input_contents")
@@ -4067,7 +4081,7 @@ class UVSystem(Disinfection):
         self.residence_time = residence_time
         self.set_dosing_rate({"UVLight": intensity})
         self.set_dosing_area({"UVLight": area})
-        self.tags = tags
+        self.tags = {} if tags is None else tags
 
     def __repr__(self):
         return (
@@ -4155,11 +4169,11 @@ class Flaring(Node):
         Data tags associated with this flare
     """
 
-    def __init__(self, id, num_units, min_flow, max_flow, design_flow, tags={}):
+    def __init__(self, id, num_units, min_flow, max_flow, design_flow, tags=None):
         self.id = id
         self.input_contents = [utils.ContentsType.Biogas]
         self.num_units = num_units
-        self.tags = tags
+        self.tags = {} if tags is None else tags
         self.min_flow = min_flow
         self.max_flow = max_flow
         self.design_flow = design_flow
@@ -4168,7 +4182,7 @@ class Flaring(Node):
         return (
             f"<pype_schema.node.Flaring id:{self.id} "
             f"input_contents:{self.input_contents} num_units:{self.num_units} "
-            f"min_flow:{self.min_flow} max_flow:{self.max_flow}"
+            f"min_flow:{self.min_flow} max_flow:{self.max_flow} "
             f"design_flow:{self.design_flow} tags:{self.tags}>\n"
         )
 
@@ -1,14 +1,43 @@
+import os
 import json
+import math
+import mmap
 import pint
 import copy
 import warnings
 from collections import defaultdict
+from functools import partial
 from .tag import DownsampleType, TagType, Tag, VirtualTag, CONTENTLESS_TYPES
 from .logbook import Logbook
 from . import connection
 from . import node
 from . import utils
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# name -> member mappings so that hot parsing paths can use plain dict lookups
+CONTENTS_MEMBERS = utils.ContentsType.__members__
+TAG_TYPE_MEMBERS = TagType.__members__
+DOWNSAMPLE_TYPE_MEMBERS = DownsampleType.__members__
+PUMP_TYPE_MEMBERS = utils.PumpType.__members__
+DIGESTER_TYPE_MEMBERS = utils.DigesterType.__members__
+DOSING_TYPE_MEMBERS = utils.DosingType.__members__
+
+# named (but still tuple-compatible) return types of the range parsing helpers
+MinMaxDesign = utils.MinMaxDesign
+HeatingValues = utils.HeatingValues
+
+# configuration files larger than this many bytes are memory-mapped when parsed
+# with orjson instead of being read into an intermediate bytes object
+_MMAP_THRESHOLD = 1 << 20
+
+# default dictionaries copied by `min_max_design_to_dict`/`heating_values_to_dict`
+_MIN_MAX_DESIGN_TEMPLATE = {"min": None, "max": None, "design": None, "units": None}
+_HEATING_VALUES_TEMPLATE = {"lower": None, "higher": None, "units": "BTU/scf"}
+
 
 class JSONParser:
     """A parser to convert a JSON file into a `Network` object
@@ -31,13 +60,88 @@ class JSONParser:
     """
 
     def __init__(self, path):
-        f = open(path)
         self.path = path
-        self.config = json.load(f)
+        with open(path, "rb") as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    with memoryview(buf) as data:
+                        self.config = JSONParser.loads(data)
+            else:
+                self.config = JSONParser.loads(f.read())
         self.network_obj = node.Network(
             "ParentNetwork", None, None, tags={}, nodes={}, connections={}
         )
-        f.close()
+
+    @staticmethod
+    def loads(data):
+        """Parses JSON text, using the optional `orjson` package when available
+
+        Parameters
+        ----------
+        data : bytes, memoryview, or str
+            JSON text to parse
+
+        Returns
+        -------
+        dict
+            the parsed JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # the standard library also accepts NaN and Infinity,
+                # and raises the usual error for truly invalid JSON
+                pass
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    @classmethod
+    def from_stream(cls, path):
+        """Creates a parser by streaming the top-level entries of a JSON file.
+        This avoids holding the raw JSON text and the parsed dictionary in memory
+        at the same time, which matters for very large configurations.
+        Requires the optional `ijson` package. Files containing `NaN` or
+        `Infinity`, which `ijson` cannot parse, are read in full instead
+
+        Parameters
+        ----------
+        path : str
+            path to the JSON file to load
+
+        Raises
+        ------
+        ImportError
+            If `ijson` is not installed
+
+        Returns
+        -------
+        JSONParser
+            parser with the same `config` as `JSONParser(path)`
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError(
+                "Streaming JSON configurations requires ijson. "
+                + "Please install it with `pip install ijson`"
+            )
+
+        parser = cls.__new__(cls)
+        parser.path = path
+        with open(path, "rb") as f:
+            try:
+                parser.config = dict(ijson.kvitems(f, "", use_float=True))
+            except ijson.JSONError:
+                # ijson rejects the `NaN` and `Infinity` literals that `to_json`
+                # writes for non-finite values, so read such files in full
+                f.seek(0)
+                parser.config = cls.loads(f.read())
+        parser.network_obj = node.Network(
+            "ParentNetwork", None, None, tags={}, nodes={}, connections={}
+        )
+        return parser
 
     def initialize_network(self, verbose=False):
         """Converts a dictionary into a `Network` object
@@ -53,19 +157,14 @@ class JSONParser:
             a Python object with all the values from the JSON file
             stored hierarchically
         """
-        for node_id in self.config["nodes"]:
-            # check that node exists in dictionary (NameError)
-            if node_id not in self.config:
-                raise NameError("Node " + node_id + " not found in " + self.path)
-            if verbose:
-                print(f"Initializing network, adding node {node_id}...")
-            self.network_obj.add_node(self.create_node(node_id))
+        # check that all nodes and connections exist in dictionary (NameError)
+        self._check_ids()
+        # all top-level nodes share a single worklist, which reports each node
+        # just before it is created when `verbose` is set
+        self._create_node_tree(self.config["nodes"], self.network_obj, verbose=verbose)
         for connection_id in self.config["connections"]:
             if verbose:
                 print(f"Initializing network, adding connection {connection_id}...")
-            # check that connection exists in dictionary (NameError)
-            if connection_id not in self.config:
-                raise NameError(f"Connection {connection_id} not found in {self.path}")
             self.network_obj.add_connection(
                 self.create_connection(connection_id, self.network_obj)
             )
@@ -74,6 +173,23 @@ class JSONParser:
         # TODO: check for unused fields and throw a warning for each
         return self.network_obj
 
+    def _check_ids(self):
+        """Checks that every top-level node and connection is defined in the
+        configuration, using one set difference per list
+
+        Raises
+        ------
+        NameError:
+            When a node or connection listed in the configuration is not defined
+        """
+        for key, label in (("nodes", "Node"), ("connections", "Connection")):
+            ids = self.config[key]
+            missing = set(ids).difference(self.config)
+            if missing:
+                # report the first missing id in configuration order
+                obj_id = next(obj_id for obj_id in ids if obj_id in missing)
+                raise NameError(f"{label} {obj_id} not found in {self.path}")
+
     def collect_virtual_tags(self, config, obj_id=None, virtual_tags=None):
         """Recursively collects all virtual tags in a network's dictionary
         representation (i.e. config)
@@ -127,6 +243,9 @@ class JSONParser:
         config_v_tags = self.collect_virtual_tags(self.config)
         network_v_tags = {}
         if config_v_tags:
+            # index every tag in the network once instead of searching the
+            # whole network for each constituent tag
+            tag_index = self._tag_index(self.network_obj)
             # Create a queue of virtual tags to add
             v_tag_queue = [
                 (v_tag_id, v_tag_info)
@@ -148,7 +267,11 @@ class JSONParser:
                         )
                     )
                     v_tag = self.parse_virtual_tag(
-                        v_tag_id, v_tag_info, obj, parent_network=self.network_obj
+                        v_tag_id,
+                        v_tag_info,
+                        obj,
+                        parent_network=self.network_obj,
+                        tag_index=tag_index,
                     )
                     if verbose:
                         print(
@@ -156,16 +279,17 @@ class JSONParser:
                             "tag {} to {}...".format(v_tag_id, obj.id)
                         )
                     obj.add_tag(v_tag)
+                    tag_index.setdefault(v_tag_id, v_tag)
                 # If there is a Key error, it may be because a virtual tag
                 # is pointing to another virtual tag that hasn't been added yet.
                 except KeyError as ex:
                     for tag_pointer in v_tag_info["tags"]:
                         # Check if the tag being pointed to is in the already
                         # initialized tags or the network's set of virtual tags
-                        if tag_pointer not in config_v_tags and tag_pointer not in [
-                            tag.id
-                            for tag in self.network_obj.get_all_tags(recurse=True)
-                        ]:
+                        if (
+                            tag_pointer not in config_v_tags
+                            and tag_pointer not in tag_index
+                        ):
                             raise KeyError(
                                 f"Invalid Tag id {tag_pointer} in VirtualTag {v_tag_id}"
                             )
@@ -195,6 +319,10 @@ class JSONParser:
         TypeError:
             When user does not provide a valid path or Network object for `old_network`
 
+        NameError:
+            When a node or connection listed in the configuration is not defined.
+            Raised before `old_network` is modified
+
         Returns
         -------
         pype_schema.node.Network:
@@ -206,24 +334,19 @@ class JSONParser:
             raise TypeError(
                 "Please provide a valid json path or object for network to merge with"
             )
-        for node_id in self.config["nodes"]:
-            if node_id not in self.config:
-                raise NameError("Node " + node_id + " not found in " + self.path)
-            # delete existing node before creating the new one if necessary
-            elif hasattr(old_network, "nodes") and node_id in old_network.nodes.keys():
-                old_network.remove_node(node_id)
-            old_network.add_node(self.create_node(node_id))
+        # validate the configuration before modifying `old_network`
+        self._check_ids()
+
+        old_nodes = old_network.nodes
+        old_connections = old_network.connections
+        # delete existing nodes in bulk so they are re-created in config order
+        for node_id in old_nodes.keys() & self.config["nodes"]:
+            del old_nodes[node_id]
+        self._create_node_tree(self.config["nodes"], old_network)
+        # delete existing connections before creating the new ones
+        for connection_id in old_connections.keys() & self.config["connections"]:
+            del old_connections[connection_id]
         for connection_id in self.config["connections"]:
-            if connection_id not in self.config:
-                raise NameError(
-                    "Connection " + connection_id + " not found in " + self.path
-                )
-            # delete existing connection before creating the new one if necessary
-            if (
-                hasattr(old_network, "connections")
-                and connection_id in old_network.connections.keys()
-            ):
-                old_network.remove_connection(connection_id)
             old_network.add_connection(
                 self.create_connection(connection_id, old_network)
             )
@@ -422,7 +545,71 @@ class JSONParser:
         return modified_network
 
     def create_node(self, node_id, verbose=False):
-        """Converts a dictionary into a `Node` object
+        """Converts a dictionary into a `Node` object.
+        Nested networks are built with an explicit stack rather than recursion
+
+        Parameters
+        ----------
+        node_id : str
+            the string id for the `Node`
+
+        verbose : bool
+            Whether to print informative messages for debugging. Default is False
+
+        Returns
+        -------
+        Node
+            a Python object with all the values from key `node_id`
+        """
+        return self._create_node_tree([node_id], verbose=verbose)[0]
+
+    def _create_node_tree(self, node_ids, parent_obj=None, verbose=False):
+        """Builds each node in `node_ids` along with all of its descendants.
+        Nested networks are built with an explicit stack rather than recursion
+
+        Parameters
+        ----------
+        node_ids : list of str
+            the string ids of the `Node` objects to create
+
+        parent_obj : Network
+            Network to add the created nodes to. If `None` they are only returned
+
+        verbose : bool
+            Whether to print informative messages for debugging. Default is False
+
+        Returns
+        -------
+        list of Node
+            the created nodes in the same order as `node_ids`
+        """
+        root_objs = []
+        networks = []
+        node_stack = [(node_id, parent_obj) for node_id in reversed(node_ids)]
+        while node_stack:
+            child_id, container = node_stack.pop()
+            node_obj = self._create_single_node(child_id, verbose=verbose)
+            if container is parent_obj:
+                root_objs.append(node_obj)
+            if container is not None:
+                container.add_node(node_obj)
+            if isinstance(node_obj, node.Network):
+                networks.append(node_obj)
+                # push in reverse so that children are added in their JSON order
+                for new_node in reversed(self.config[child_id]["nodes"]):
+                    node_stack.append((new_node, node_obj))
+
+        # connections are created last so that all of their endpoints exist
+        for network_obj in networks:
+            for new_connection in self.config[network_obj.id]["connections"]:
+                network_obj.add_connection(
+                    self.create_connection(new_connection, network_obj)
+                )
+        return root_objs
+
+    def _create_single_node(self, node_id, verbose=False):
+        """Converts a dictionary into a `Node` object without its children.
+        `nodes` and `connections` of a `Network` are added by `create_node`
 
         Parameters
         ----------
@@ -439,516 +626,638 @@ class JSONParser:
         """
         if verbose:
             print("Creating node:", node_id)
+        node_config = self.config[node_id]
+        node_type = node_config["type"]
         (input_contents, output_contents) = self.parse_contents(node_id)
-        elevation = self.parse_unit_val_dict(self.config[node_id].get("elevation"))
+        elevation = self.parse_unit_val_dict(node_config.get("elevation"))
         # strings like `elevation (meters)` and `volume (cubic meters)`
         # are included for backwards compatability
         if elevation is None:
-            elevation = utils.parse_quantity(
-                self.config[node_id].get("elevation (meters)"), "m"
-            )
+            elevation = utils.parse_quantity(node_config.get("elevation (meters)"), "m")
             warnings.warn(
                 "Please switch to new dictionary syntax for elevation with units",
                 FutureWarning,
             )
-        num_units = self.config[node_id].get("num_units")
-        volume = self.parse_unit_val_dict(self.config[node_id].get("volume"))
+        num_units = node_config.get("num_units")
+        volume = self.parse_unit_val_dict(node_config.get("volume"))
         if volume is None:
             volume = utils.parse_quantity(
-                self.config[node_id].get("volume (cubic meters)"), "m3"
+                node_config.get("volume (cubic meters)"), "m3"
             )
             warnings.warn(
                 "Please switch to new dictionary syntax for volume with units",
                 FutureWarning,
             )
 
-        flowrate = self.config[node_id].get("flowrate")
+        flowrate = node_config.get("flowrate")
         if flowrate is None:
-            flowrate = self.config[node_id].get("flow_rate")
+            flowrate = node_config.get("flow_rate")
 
-        min_flow, max_flow, design_flow = self.parse_min_max_design(flowrate)
+        flow = self.parse_min_max_design(flowrate)
         dosing_rate = self.parse_dosing_rate(
-            self.config[node_id].get("dosing_rate", defaultdict(float))
+            node_config.get("dosing_rate", defaultdict(float))
         )
 
         # create correct type of node class
-        if self.config[node_id]["type"] in ["Network", "Facility", "ModularUnit"]:
-            num_units = 1 if num_units is None else num_units
-            if self.config[node_id]["type"] == "Network":
-                node_obj = node.Network(
-                    node_id,
-                    input_contents,
-                    output_contents,
-                    tags={},
-                    nodes={},
-                    connections={},
-                    num_units=num_units,
-                )
-            elif self.config[node_id]["type"] == "Facility":
-                node_obj = node.Facility(
-                    node_id,
-                    input_contents,
-                    output_contents,
-                    elevation,
-                    min_flow,
-                    max_flow,
-                    design_flow,
-                    tags={},
-                    nodes={},
-                    connections={},
-                )
-            elif self.config[node_id]["type"] == "ModularUnit":
-                node_obj = node.ModularUnit(
-                    node_id,
-                    input_contents,
-                    output_contents,
-                    num_units,
-                    tags={},
-                    nodes={},
-                    connections={},
-                )
-
-            for new_node in self.config[node_id]["nodes"]:
-                node_obj.add_node(self.create_node(new_node))
-            for new_connection in self.config[node_id]["connections"]:
-                node_obj.add_connection(
-                    self.create_connection(new_connection, node_obj)
-                )
-        elif self.config[node_id]["type"] == "Battery":
-            energy_capacity = self.parse_unit_val_dict(
-                self.config[node_id].get("energy_capacity")
-            )
-            discharge_rate = self.parse_unit_val_dict(
-                self.config[node_id].get("discharge_rate")
-            )
-            charge_rate = self.parse_unit_val_dict(
-                self.config[node_id].get("charge_rate")
-            )
-            if energy_capacity is None:
-                energy_capacity = utils.parse_quantity(
-                    self.config[node_id].get("capacity (kWh)"), "kwh"
-                )
-                warnings.warn(
-                    "Please switch to new dictionary syntax "
-                    + "for energy capacity with units",
-                    FutureWarning,
-                )
-            if discharge_rate is None:
-                discharge_rate = utils.parse_quantity(
-                    self.config[node_id].get("discharge_rate (kW)"), "kw"
-                )
-                warnings.warn(
-                    "Please switch to new dictionary syntax "
-                    + "for discharge rate with units",
-                    FutureWarning,
-                )
-            if charge_rate is None:
-                charge_rate = utils.parse_quantity(
-                    self.config[node_id].get("charge_rate (kW)"), "kw"
-                )
-                warnings.warn(
-                    "Please switch to new dictionary syntax for charge rate with units",
-                    FutureWarning,
-                )
-            # if either discharge or charge rate are null assume they are the same
-            if discharge_rate is None and charge_rate is None:
-                warnings.warn(
-                    "Battery object {} has no charge or discharge rate defined".format(
-                        node_id
-                    )
-                )
-            elif charge_rate is None:
-                charge_rate = discharge_rate
-            elif discharge_rate is None:
-                discharge_rate = charge_rate
-            rte = self.config[node_id].get("rte")
-            leakage = self.parse_unit_val_dict(self.config[node_id].get("leakage"))
-            node_obj = node.Battery(
-                node_id,
-                energy_capacity,
-                charge_rate,
-                discharge_rate,
-                rte,
-                leakage,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Pump":
-            pump_type = self.config[node_id].get("pump_type")
-            if pump_type is None:
-                pump_type = utils.PumpType.Constant
-            else:
-                pump_type = utils.PumpType[pump_type]
+        builder = _NODE_BUILDERS.get(node_type)
+        if builder is None:
+            raise TypeError("Unsupported Node type: " + node_type)
+        node_obj = builder(
+            self,
+            node_id,
+            node_type,
+            node_config,
+            input_contents,
+            output_contents,
+            elevation,
+            volume,
+            num_units,
+            flow,
+            dosing_rate,
+        )
 
-            power_rating = self.parse_unit_val_dict(
-                self.config[node_id].get("power_rating")
-            )
-            if power_rating is None:
-                power_rating = utils.parse_quantity(
-                    self.config[node_id].get("horsepower"), "hp"
-                )
-                warnings.warn(
-                    "Please switch to new dictionary syntax "
-                    + "for power rating with units",
-                    FutureWarning,
-                )
-            node_obj = node.Pump(
-                node_id,
-                input_contents,
-                output_contents,
-                elevation,
-                min_flow,
-                max_flow,
-                design_flow,
-                power_rating,
-                num_units,
-                pump_type=pump_type,
-                tags={},
-            )
+        tags = node_config.get("tags")
+        if tags:
+            contents_list = []
+            seen_contents = set()
+            for tag_id, tag_info in tags.items():
+                # ensure that the destination ID for Node-associated Tags is null
+                tag_info["dest_unit_id"] = None
+                tag = self.parse_tag(tag_id, tag_info, node_obj)
+                node_obj.add_tag(tag)
 
-            efficiency = self.config[node_id].get("efficiency")
-            if efficiency is None:
-                pump_curve = self.config[node_id].get("pump_curve")
-            else:
-                pump_curve = efficiency
-            if pump_curve:
+                # `parse_tag` has already resolved explicitly given contents,
+                # so reuse them instead of looking the name up again
+                if tag_info.get("contents") is not None:
+                    contents = tag.contents
+                    if contents not in seen_contents:
+                        seen_contents.add(contents)
+                        contents_list.append(contents)
 
-                def efficiency_curve(arg):
-                    # TODO: fix this so that it interpolates between dictionary values
-                    if type(pump_curve) is dict:
-                        return pump_curve[arg]
-                    else:
-                        return float(pump_curve)
+            tags_by_contents_map = self._group_tags_by_contents(node_obj.tags)
 
-                node_obj.set_pump_curve(efficiency_curve)
-        elif self.config[node_id]["type"] == "Reservoir":
-            node_obj = node.Reservoir(
-                node_id, input_contents, output_contents, elevation, volume, tags={}
-            )
-        elif self.config[node_id]["type"] == "Tank":
-            node_obj = node.Tank(
-                node_id,
-                input_contents,
-                output_contents,
-                elevation,
-                volume,
-                num_units,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Aeration":
-            node_obj = node.Aeration(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Clarification":
-            node_obj = node.Clarification(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                tags={},
-            )
-        elif self.config[node_id]["type"] in ["Cogeneration", "Boiler"]:
-            gen_capacity = self.config[node_id].get("generation_capacity")
-            if gen_capacity is None:
-                self.config[node_id].get("gen_capacity")
-            min, max, design = self.parse_min_max_design(gen_capacity)
-            if self.config[node_id]["type"] == "Cogeneration":
-                node_obj = node.Cogeneration(
-                    node_id, input_contents, min, max, design, num_units, tags={}
-                )
-                electrical_efficiency = self.config[node_id].get(
-                    "electrical efficiency"
-                )
-                if electrical_efficiency is None:
-                    electrical_efficiency = self.config[node_id].get(
-                        "electrical_efficiency"
+            for contents in contents_list:
+                tags_by_contents = tags_by_contents_map[contents]
+                if len(tags_by_contents) <= 1:
+                    continue
+                tag_source_unit_ids = [tag.source_unit_id for tag in tags_by_contents]
+                if "total" not in tag_source_unit_ids:
+                    tag_obj = tags_by_contents[0]
+                    tag_id = (
+                        f"{node_id}_{tag_obj.contents.name}_{tag_obj.tag_type.name}"
                     )
-                thermal_efficiency = self.config[node_id].get("thermal efficiency")
-                if thermal_efficiency is None:
-                    thermal_efficiency = self.config[node_id].get("thermal_efficiency")
-            else:
-                node_obj = node.Boiler(
-                    node_id, input_contents, min, max, design, num_units, tags={}
-                )
-                electrical_efficiency = None
-                thermal_efficiency = self.config[node_id].get("thermal efficiency")
-
-            if electrical_efficiency:
-
-                def efficiency_curve(arg):
-                    # TODO: fix this so that it interpolates between dictionary values
-                    if type(electrical_efficiency) is dict:
-                        return electrical_efficiency[arg]
-                    else:
-                        return float(electrical_efficiency)
-
-                node_obj.set_electrical_efficiency(efficiency_curve)
-
-            if thermal_efficiency:
-
-                def efficiency_curve(arg):
-                    # TODO: fix this so that it interpolates between dictionary values
-                    if type(thermal_efficiency) is dict:
-                        return thermal_efficiency[arg]
-                    else:
-                        return float(thermal_efficiency)
+                    operations = utils.get_tag_sum_lambda_func(tag_source_unit_ids)
+                    v_tag = VirtualTag(tag_id, tags_by_contents, operations=operations)
+                    node_obj.add_tag(v_tag)
+        return node_obj
 
-                node_obj.set_thermal_efficiency(efficiency_curve)
-        elif self.config[node_id]["type"] == "Digestion":
-            digester_type = self.config[node_id].get("digester_type")
-            node_obj = node.Digestion(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                utils.DigesterType[digester_type],
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Filtration":
-            settling_time = self.parse_unit_val_dict(
-                self.config[node_id].get("settling_time", {"value": 0.0})
-            )
-            node_obj = node.Filtration(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                dosing_rate=dosing_rate,
-                settling_time=settling_time,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "ROMembrane":
-            area = self.parse_unit_val_dict(self.config[node_id].get("area"))
-            permeability = self.parse_unit_val_dict(
-                self.config[node_id].get("permeability")
-            )
-            selectivity = self.parse_unit_val_dict(
-                self.config[node_id].get("selectivity")
-            )
-            settling_time = self.parse_unit_val_dict(
-                self.config[node_id].get("settling_time", {"value": 0.0})
-            )
-            node_obj = node.ROMembrane(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                area,
-                permeability,
-                selectivity,
-                dosing_rate=dosing_rate,
-                settling_time=settling_time,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Chlorination":
-            residence_time = self.parse_unit_val_dict(
-                self.config[node_id].get("residence_time")
-            )
-            node_obj = node.Chlorination(
+    def _create_network(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Network`, `Facility`, or `ModularUnit` without its children"""
+        num_units = 1 if num_units is None else num_units
+        if node_type == "Network":
+            return node.Network(
                 node_id,
                 input_contents,
                 output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                dosing_rate=dosing_rate,
-                residence_time=residence_time,
                 tags={},
+                nodes={},
+                connections={},
+                num_units=num_units,
             )
-        elif self.config[node_id]["type"] == "Disinfection":
-            residence_time = self.parse_unit_val_dict(
-                self.config[node_id].get("residence_time")
-            )
-            node_obj = node.Disinfection(
+        elif node_type == "Facility":
+            min_flow, max_flow, design_flow = flow
+            return node.Facility(
                 node_id,
                 input_contents,
                 output_contents,
+                elevation,
                 min_flow,
                 max_flow,
                 design_flow,
-                num_units,
-                volume,
-                dosing_rate=dosing_rate,
-                residence_time=residence_time,
                 tags={},
+                nodes={},
+                connections={},
             )
-        elif self.config[node_id]["type"] == "UVSystem":
-            area = self.parse_unit_val_dict(self.config[node_id].get("area"))
-            intensity = self.parse_unit_val_dict(self.config[node_id].get("intensity"))
-            residence_time = self.parse_unit_val_dict(
-                self.config[node_id].get("residence_time")
-            )
-            node_obj = node.UVSystem(
+        else:
+            return node.ModularUnit(
                 node_id,
                 input_contents,
                 output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                residence_time,
-                intensity,
-                area,
-                tags={},
-            )
-        elif self.config[node_id]["type"] == "Flaring":
-            node_obj = node.Flaring(
-                node_id,
                 num_units,
-                min_flow,
-                max_flow,
-                design_flow,
                 tags={},
+                nodes={},
+                connections={},
             )
-        elif self.config[node_id]["type"] == "Thickening":
-            node_obj = node.Thickening(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                tags={},
+
+    def _create_battery(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Battery` node"""
+        energy_capacity = self.parse_unit_val_dict(node_config.get("energy_capacity"))
+        discharge_rate = self.parse_unit_val_dict(node_config.get("discharge_rate"))
+        charge_rate = self.parse_unit_val_dict(node_config.get("charge_rate"))
+        if energy_capacity is None:
+            energy_capacity = utils.parse_quantity(
+                node_config.get("capacity (kWh)"), "kwh"
             )
-        elif self.config[node_id]["type"] == "Screening":
-            node_obj = node.Screening(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                tags={},
+            warnings.warn(
+                "Please switch to new dictionary syntax "
+                + "for energy capacity with units",
+                FutureWarning,
             )
-        elif self.config[node_id]["type"] == "Conditioning":
-            node_obj = node.Conditioning(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                tags={},
+        if discharge_rate is None:
+            discharge_rate = utils.parse_quantity(
+                node_config.get("discharge_rate (kW)"), "kw"
             )
-        elif self.config[node_id]["type"] == "Reactor":
-            pH = self.config[node_id].get("pH")
-            residence_time = self.parse_unit_val_dict(
-                self.config[node_id].get("residence_time")
+            warnings.warn(
+                "Please switch to new dictionary syntax "
+                + "for discharge rate with units",
+                FutureWarning,
             )
-            node_obj = node.Reactor(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                residence_time,
-                dosing_rate=dosing_rate,
-                pH=pH,
-                tags={},
+        if charge_rate is None:
+            charge_rate = utils.parse_quantity(
+                node_config.get("charge_rate (kW)"), "kw"
             )
-        elif self.config[node_id]["type"] == "StaticMixer":
-            pH = self.config[node_id].get("pH")
-            residence_time = self.parse_unit_val_dict(
-                self.config[node_id].get("residence_time")
+            warnings.warn(
+                "Please switch to new dictionary syntax for charge rate with units",
+                FutureWarning,
             )
-            node_obj = node.StaticMixer(
-                node_id,
-                input_contents,
-                output_contents,
-                min_flow,
-                max_flow,
-                design_flow,
-                num_units,
-                volume,
-                residence_time,
-                dosing_rate=dosing_rate,
-                pH=pH,
-                tags={},
+        # if either discharge or charge rate are null assume they are the same
+        if discharge_rate is None and charge_rate is None:
+            warnings.warn(
+                "Battery object {} has no charge or discharge rate defined".format(
+                    node_id
+                )
             )
-        elif self.config[node_id]["type"] == "Joint":
-            node_obj = node.Joint(
-                node_id,
-                input_contents,
-                output_contents,
-                tags={},
+        elif charge_rate is None:
+            charge_rate = discharge_rate
+        elif discharge_rate is None:
+            discharge_rate = charge_rate
+        rte = node_config.get("rte")
+        leakage = self.parse_unit_val_dict(node_config.get("leakage"))
+        return node.Battery(
+            node_id,
+            energy_capacity,
+            charge_rate,
+            discharge_rate,
+            rte,
+            leakage,
+            tags={},
+        )
+
+    def _create_pump(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Pump` node"""
+        pump_type = node_config.get("pump_type")
+        # an explicit null also falls back to the default pump type
+        if pump_type is None:
+            pump_type = utils.PumpType.Constant
+        else:
+            pump_type = PUMP_TYPE_MEMBERS[pump_type]
+
+        power_rating = self.parse_unit_val_dict(node_config.get("power_rating"))
+        if power_rating is None:
+            power_rating = utils.parse_quantity(node_config.get("horsepower"), "hp")
+            warnings.warn(
+                "Please switch to new dictionary syntax "
+                + "for power rating with units",
+                FutureWarning,
             )
+        min_flow, max_flow, design_flow = flow
+        node_obj = node.Pump(
+            node_id,
+            input_contents,
+            output_contents,
+            elevation,
+            min_flow,
+            max_flow,
+            design_flow,
+            power_rating,
+            num_units,
+            pump_type=pump_type,
+            tags={},
+        )
+
+        efficiency = node_config.get("efficiency")
+        if efficiency is None:
+            pump_curve = node_config.get("pump_curve")
         else:
-            raise TypeError("Unsupported Node type: " + self.config[node_id]["type"])
+            pump_curve = efficiency
+        if pump_curve:
+            node_obj.set_pump_curve(utils.efficiency_curve(pump_curve))
+        return node_obj
 
-        tags = self.config[node_id].get("tags")
-        if tags:
-            contents_list = []
-            for tag_id, tag_info in tags.items():
-                # ensure that the destination ID for Node-associated Tags is null
-                tag_info["dest_unit_id"] = None
-                tag = self.parse_tag(tag_id, tag_info, node_obj)
-                node_obj.add_tag(tag)
-                contents_type = tag_info.get("contents")
+    def _create_reservoir(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Reservoir` node"""
+        return node.Reservoir(
+            node_id, input_contents, output_contents, elevation, volume, tags={}
+        )
 
-                if (
-                    contents_type is not None
-                    and utils.ContentsType[contents_type] not in contents_list
-                ):
-                    contents_list.append(utils.ContentsType[tag_info["contents"]])
+    def _create_tank(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Tank` node"""
+        return node.Tank(
+            node_id,
+            input_contents,
+            output_contents,
+            elevation,
+            volume,
+            num_units,
+            tags={},
+        )
 
-            for contents in contents_list:
-                if contents is not None:
-                    tags_by_contents = [
-                        tag_obj
-                        for _, tag_obj in node_obj.tags.items()
-                        if tag_obj.contents == contents
-                    ]
-                    tag_source_unit_ids = [
-                        tag.source_unit_id for tag in tags_by_contents
-                    ]
-                    if (
-                        "total" not in tag_source_unit_ids
-                        and len(tag_source_unit_ids) > 1
-                    ):
-                        tag_obj = tags_by_contents[0]
-                        tag_id = "_".join(
-                            [node_id, tag_obj.contents.name, tag_obj.tag_type.name]
-                        )
-                        operations = utils.get_tag_sum_lambda_func(tag_source_unit_ids)
-                        v_tag = VirtualTag(
-                            tag_id, tags_by_contents, operations=operations
-                        )
-                        node_obj.add_tag(v_tag)
+    def _create_vessel(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates an `Aeration`, `Clarification`, or `Thickening` node"""
+        min_flow, max_flow, design_flow = flow
+        return getattr(node, node_type)(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            tags={},
+        )
+
+    def _create_generator(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Cogeneration` or `Boiler` node"""
+        gen_capacity = node_config.get("generation_capacity")
+        if gen_capacity is None:
+            gen_capacity = node_config.get("gen_capacity")
+        min, max, design = self.parse_min_max_design(gen_capacity)
+        if node_type == "Cogeneration":
+            node_obj = node.Cogeneration(
+                node_id, input_contents, min, max, design, num_units, tags={}
+            )
+            electrical_efficiency = node_config.get("electrical efficiency")
+            if electrical_efficiency is None:
+                electrical_efficiency = node_config.get("electrical_efficiency")
+            thermal_efficiency = node_config.get("thermal efficiency")
+            if thermal_efficiency is None:
+                thermal_efficiency = node_config.get("thermal_efficiency")
+        else:
+            node_obj = node.Boiler(
+                node_id, input_contents, min, max, design, num_units, tags={}
+            )
+            electrical_efficiency = None
+            thermal_efficiency = node_config.get("thermal efficiency")
+
+        if electrical_efficiency:
+            node_obj.set_electrical_efficiency(
+                utils.efficiency_curve(electrical_efficiency)
+            )
+
+        if thermal_efficiency:
+            node_obj.set_thermal_efficiency(utils.efficiency_curve(thermal_efficiency))
         return node_obj
 
+    def _create_digestion(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Digestion` node"""
+        digester_type = node_config.get("digester_type")
+        min_flow, max_flow, design_flow = flow
+        return node.Digestion(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            DIGESTER_TYPE_MEMBERS[digester_type],
+            tags={},
+        )
+
+    def _create_filtration(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Filtration` node"""
+        settling_time = self.parse_unit_val_dict(
+            node_config.get("settling_time", {"value": 0.0})
+        )
+        min_flow, max_flow, design_flow = flow
+        return node.Filtration(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            dosing_rate=dosing_rate,
+            settling_time=settling_time,
+            tags={},
+        )
+
+    def _create_ro_membrane(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `ROMembrane` node"""
+        area = self.parse_unit_val_dict(node_config.get("area"))
+        permeability = self.parse_unit_val_dict(node_config.get("permeability"))
+        selectivity = self.parse_unit_val_dict(node_config.get("selectivity"))
+        settling_time = self.parse_unit_val_dict(
+            node_config.get("settling_time", {"value": 0.0})
+        )
+        min_flow, max_flow, design_flow = flow
+        return node.ROMembrane(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            area,
+            permeability,
+            selectivity,
+            dosing_rate=dosing_rate,
+            settling_time=settling_time,
+            tags={},
+        )
+
+    def _create_disinfection(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Chlorination` or `Disinfection` node"""
+        residence_time = self.parse_unit_val_dict(node_config.get("residence_time"))
+        min_flow, max_flow, design_flow = flow
+        return getattr(node, node_type)(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            dosing_rate=dosing_rate,
+            residence_time=residence_time,
+            tags={},
+        )
+
+    def _create_uv_system(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `UVSystem` node"""
+        area = self.parse_unit_val_dict(node_config.get("area"))
+        intensity = self.parse_unit_val_dict(node_config.get("intensity"))
+        residence_time = self.parse_unit_val_dict(node_config.get("residence_time"))
+        min_flow, max_flow, design_flow = flow
+        return node.UVSystem(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            residence_time,
+            intensity,
+            area,
+            tags={},
+        )
+
+    def _create_flaring(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Flaring` node"""
+        min_flow, max_flow, design_flow = flow
+        return node.Flaring(
+            node_id,
+            num_units,
+            min_flow,
+            max_flow,
+            design_flow,
+            tags={},
+        )
+
+    def _create_flow_unit(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Screening` or `Conditioning` node"""
+        min_flow, max_flow, design_flow = flow
+        return getattr(node, node_type)(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            tags={},
+        )
+
+    def _create_reactor(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Reactor` or `StaticMixer` node"""
+        pH = node_config.get("pH")
+        residence_time = self.parse_unit_val_dict(node_config.get("residence_time"))
+        min_flow, max_flow, design_flow = flow
+        return getattr(node, node_type)(
+            node_id,
+            input_contents,
+            output_contents,
+            min_flow,
+            max_flow,
+            design_flow,
+            num_units,
+            volume,
+            residence_time,
+            dosing_rate=dosing_rate,
+            pH=pH,
+            tags={},
+        )
+
+    def _create_joint(
+        self,
+        node_id,
+        node_type,
+        node_config,
+        input_contents,
+        output_contents,
+        elevation,
+        volume,
+        num_units,
+        flow,
+        dosing_rate,
+    ):
+        """Creates a `Joint` node"""
+        return node.Joint(
+            node_id,
+            input_contents,
+            output_contents,
+            tags={},
+        )
+
     def create_connection(self, connection_id, node_obj, verbose=False):
         """Converts a dictionary into a `Connection` object
 
@@ -969,268 +1278,249 @@ class JSONParser:
         Connection
             a Python object with all the values from key `connection_id`
         """
-        if verbose:
-            print(
-                "Creating connection {} in node {}".format(connection_id, node_obj.id)
-            )
-        contents = self.config[connection_id].get("contents")
-        if isinstance(contents, list):
-            contents = list(map(lambda con: utils.ContentsType[con], contents))
-        else:
-            contents = utils.ContentsType[contents]
-
-        bidirectional = self.config[connection_id].get("bidirectional", False)
-        source_id = self.config[connection_id].get("source")
-
-        if source_id:
-            source = node_obj.get_node(source_id)
-
-        exit_point = self.config[connection_id].get("exit_point")
-        if exit_point:
-            exit_point = source.get_node(exit_point)
-
-        dest_id = self.config[connection_id].get("destination")
-        if dest_id:
-            destination = node_obj.get_node(dest_id)
-
-        entry_point = self.config[connection_id].get("entry_point")
-        if entry_point:
-            entry_point = destination.get_node(entry_point)
-
-        flowrate = self.config[connection_id].get("flowrate")
-        if flowrate is None:
-            flowrate = self.config[connection_id].get("flow_rate")
-
-        min_flow, max_flow, design_flow = self.parse_min_max_design(flowrate)
-        min_pres, max_pres, design_pres = self.parse_min_max_design(
-            self.config[connection_id].get("pressure")
-        )
-        lower, higher = self.parse_heating_values(
-            self.config[connection_id].get("heating_values")
-        )
-
-        if self.config[connection_id]["type"] == "Pipe":
-            friction = self.config[connection_id].get("friction_coeff")
-            diameter = self.parse_unit_val_dict(
-                self.config[connection_id].get("diameter")
-            )
-            if diameter is None:
-                diameter = utils.parse_quantity(
-                    self.config[connection_id].get("diameter (inches)"), "in"
-                )
-                warnings.warn(
-                    "Please switch to new dictionary syntax for diamter with units",
-                    FutureWarning,
-                )
-            connection_obj = connection.Pipe(
-                connection_id,
-                contents,
-                source,
-                destination,
-                min_flow,
-                max_flow,
-                design_flow,
-                diameter=diameter,
-                friction=friction,
-                lower_heating_value=lower,
-                higher_heating_value=higher,
-                min_pres=min_pres,
-                max_pres=max_pres,
-                design_pres=design_pres,
-                tags={},
-                bidirectional=bidirectional,
-                exit_point=exit_point,
-                entry_point=entry_point,
-            )
-        elif self.config[connection_id]["type"] == "Wire":
-            connection_obj = connection.Wire(
-                connection_id,
-                contents,
-                source,
-                destination,
-                tags={},
-                bidirectional=bidirectional,
-                exit_point=exit_point,
-                entry_point=entry_point,
-            )
-        elif self.config[connection_id]["type"] == "Wireless":
-            connection_obj = connection.Wireless(
-                connection_id,
-                contents,
-                source,
-                destination,
-                tags={},
-                bidirectional=bidirectional,
-                exit_point=exit_point,
-                entry_point=entry_point,
-            )
-        elif self.config[connection_id]["type"] == "Delivery":
-            connection_obj = connection.Delivery(
-                connection_id,
-                contents,
-                source,
-                destination,
-                tags={},
-                bidirectional=bidirectional,
-                exit_point=exit_point,
-                entry_point=entry_point,
+        if verbose:
+            print(
+                "Creating connection {} in node {}".format(connection_id, node_obj.id)
             )
+        conn_config = self.config[connection_id]
+        conn_type = conn_config["type"]
+        contents = conn_config.get("contents")
+        if isinstance(contents, list):
+            contents = [CONTENTS_MEMBERS[name] for name in contents]
         else:
-            raise TypeError(
-                "Unsupported Connection type: " + self.config[connection_id]["type"]
-            )
+            contents = CONTENTS_MEMBERS[contents]
+
+        bidirectional = conn_config.get("bidirectional", False)
+        # missing endpoints are left as None rather than unbound
+        source_id = conn_config.get("source")
+        source = node_obj.get_node(source_id) if source_id else None
+
+        exit_id = conn_config.get("exit_point")
+        exit_point = (
+            source.get_node(exit_id) if source is not None and exit_id else None
+        )
+
+        dest_id = conn_config.get("destination")
+        destination = node_obj.get_node(dest_id) if dest_id else None
 
-        tags = self.config[connection_id].get("tags")
-        exit_point_id = (
-            ""
-            if connection_obj.get_exit_point() is None
-            else "_" + connection_obj.get_exit_point().id
+        entry_id = conn_config.get("entry_point")
+        entry_point = (
+            destination.get_node(entry_id)
+            if destination is not None and entry_id
+            else None
         )
-        entry_point_id = (
-            ""
-            if connection_obj.get_entry_point() is None
-            else "_" + connection_obj.get_entry_point().id
+
+        builder = _CONNECTION_BUILDERS.get(conn_type)
+        if builder is None:
+            raise TypeError("Unsupported Connection type: " + conn_type)
+        connection_obj = builder(
+            self,
+            connection_id,
+            conn_type,
+            conn_config,
+            contents,
+            source,
+            destination,
+            bidirectional,
+            exit_point,
+            entry_point,
         )
+
+        tags = conn_config.get("tags")
         if tags:
             for tag_id, tag_info in tags.items():
                 tag = self.parse_tag(tag_id, tag_info, connection_obj)
                 connection_obj.add_tag(tag)
 
+            # ID prefixes shared by all of this connection's virtual tags
+            exit_point_obj = connection_obj.get_exit_point()
+            source_prefix = connection_obj.get_source_id()
+            if exit_point_obj is not None:
+                source_prefix = f"{source_prefix}_{exit_point_obj.id}"
+            entry_point_obj = connection_obj.get_entry_point()
+            dest_prefix = connection_obj.get_dest_id()
+            if entry_point_obj is not None:
+                dest_prefix = f"{dest_prefix}_{entry_point_obj.id}"
+
             # create virtual "total" tag if it was missing
+            conn_contents = connection_obj.contents
             contents_list = (
-                connection_obj.contents
-                if (type(connection_obj.contents) is list)
-                else [connection_obj.contents]
+                conn_contents if isinstance(conn_contents, list) else [conn_contents]
             )
 
+            tags_by_contents_map = self._group_tags_by_contents(connection_obj.tags)
+
             for contents in contents_list:
                 if contents is not None:
-                    tags_by_contents = [
-                        tag_obj
-                        for _, tag_obj in connection_obj.tags.items()
-                        if tag_obj.contents == contents
-                    ]
-                    tag_source_unit_ids = [
-                        tag.source_unit_id for tag in tags_by_contents
-                    ]
-                    tag_dest_unit_ids = [tag.dest_unit_id for tag in tags_by_contents]
-                    if (
-                        "total" not in tag_source_unit_ids
-                        and len(tag_source_unit_ids) > 1
-                    ):
-                        tag_obj = tags_by_contents[0]
-                        operations = utils.get_tag_sum_lambda_func(tag_source_unit_ids)
-                        # create a separate virtual total for each destination unit.
-                        # If none exist then just use total
-                        if tag_dest_unit_ids:
-                            for id in tag_dest_unit_ids:
-                                tag_list = [
-                                    connection_obj.tags[tag_obj.id]
-                                    for tag_obj in tags_by_contents
-                                    if tag_obj.contents == contents
-                                    and tag_obj.dest_unit_id == id
-                                ]
-                                dest_unit_id = "" if id == "total" else "_" + str(id)
-                                tag_id = "{}{}_{}{}{}_{}_{}".format(
-                                    connection_obj.get_source_id(),
-                                    exit_point_id,
-                                    connection_obj.get_dest_id(),
-                                    entry_point_id,
-                                    dest_unit_id,
-                                    tag_obj.contents.name,
-                                    tag.tag_type.name,
-                                )
-                                v_tag = VirtualTag(
-                                    tag_id,
-                                    tag_list,
-                                    operations=operations,
-                                    units=tag_obj.units,
-                                )
-                                connection_obj.add_tag(v_tag)
-
-                        else:
-                            tag_list = [
-                                connection_obj.tags[tag_obj.id]
-                                for tag_obj in tags_by_contents
-                                if tag_obj.contents == contents
-                            ]
-
-                            tag_id = "{}{}_{}{}_{}_{}".format(
-                                connection_obj.get_source_id(),
-                                exit_point_id,
-                                connection_obj.get_dest_id(),
-                                entry_point_id,
-                                tag_obj.contents.name,
-                                tag.tag_type.name,
-                            )
-                            v_tag = VirtualTag(
-                                tag_id,
-                                tag_list,
-                                operations=operations,
-                                units=tag_obj.units,
-                            )
-                            v_tag = VirtualTag(
-                                tag_id,
-                                tag_list,
-                                operations=operations,
-                                units=tag_obj.units,
-                            )
-                            connection_obj.add_tag(v_tag)
-                    if "total" not in tag_dest_unit_ids and len(tag_dest_unit_ids) > 1:
-                        tag_obj = tags_by_contents[0]
-                        operations = utils.get_tag_sum_lambda_func(tag_dest_unit_ids)
-                        # create a separate virtual total for each source unit.
-                        # If none exist then just use total
-                        if tag_source_unit_ids:
-                            for id in tag_source_unit_ids:
-                                tag_list = [
-                                    connection_obj.tags[tag_obj.id]
-                                    for tag_obj in tags_by_contents
-                                    if tag_obj.contents == contents
-                                    and tag_obj.source_unit_id == id
-                                ]
-                                source_unit_id = "" if id == "total" else "_" + str(id)
-                                tag_id = "{}{}{}_{}{}_{}_{}".format(
-                                    connection_obj.get_source_id(),
-                                    exit_point_id,
-                                    source_unit_id,
-                                    connection_obj.get_dest_id(),
-                                    entry_point_id,
-                                    tag_obj.contents.name,
-                                    tag.tag_type.name,
-                                )
-                                v_tag = VirtualTag(
-                                    tag_id,
-                                    tag_list,
-                                    operations=operations,
-                                    units=tag_obj.units,
-                                )
-                                connection_obj.add_tag(v_tag)
-                        else:
-                            tag_list = [
-                                connection_obj.tags[tag_obj.id]
-                                for tag_obj in tags_by_contents
-                                if tag_obj.contents == contents
-                            ]
-
-                            tag_id = "{}{}_{}{}_{}_{}".format(
-                                connection_obj.get_source_id(),
-                                exit_point_id,
-                                connection_obj.get_dest_id(),
-                                entry_point_id,
-                                tag_obj.contents.name,
-                                tag.tag_type.name,
-                            )
-                            v_tag = VirtualTag(
-                                tag_id,
-                                tag_list,
-                                operations=operations,
-                                units=tag_obj.units,
-                            )
-                            connection_obj.add_tag(v_tag)
+                    tags_by_contents = tags_by_contents_map[contents]
+                    # sum across source units for each destination unit
+                    self._build_virtual_total(
+                        connection_obj,
+                        tags_by_contents,
+                        "dest_unit_id",
+                        source_prefix,
+                        dest_prefix,
+                    )
+                    # sum across destination units for each source unit
+                    self._build_virtual_total(
+                        connection_obj,
+                        tags_by_contents,
+                        "source_unit_id",
+                        source_prefix,
+                        dest_prefix,
+                    )
 
         return connection_obj
 
+    def _create_pipe(
+        self,
+        connection_id,
+        conn_type,
+        conn_config,
+        contents,
+        source,
+        destination,
+        bidirectional,
+        exit_point,
+        entry_point,
+    ):
+        """Creates a `Pipe` connection"""
+        flowrate = conn_config.get("flowrate")
+        if flowrate is None:
+            flowrate = conn_config.get("flow_rate")
+
+        min_flow, max_flow, design_flow = self.parse_min_max_design(flowrate)
+        min_pres, max_pres, design_pres = self.parse_min_max_design(
+            conn_config.get("pressure")
+        )
+        lower, higher = self.parse_heating_values(conn_config.get("heating_values"))
+        friction = conn_config.get("friction_coeff")
+        diameter = self.parse_unit_val_dict(conn_config.get("diameter"))
+        if diameter is None:
+            diameter = utils.parse_quantity(conn_config.get("diameter (inches)"), "in")
+            warnings.warn(
+                "Please switch to new dictionary syntax for diamter with units",
+                FutureWarning,
+            )
+        return connection.Pipe(
+            connection_id,
+            contents,
+            source,
+            destination,
+            min_flow,
+            max_flow,
+            design_flow,
+            diameter=diameter,
+            friction=friction,
+            lower_heating_value=lower,
+            higher_heating_value=higher,
+            min_pres=min_pres,
+            max_pres=max_pres,
+            design_pres=design_pres,
+            tags={},
+            bidirectional=bidirectional,
+            exit_point=exit_point,
+            entry_point=entry_point,
+        )
+
+    def _create_link(
+        self,
+        connection_id,
+        conn_type,
+        conn_config,
+        contents,
+        source,
+        destination,
+        bidirectional,
+        exit_point,
+        entry_point,
+    ):
+        """Creates a `Wire`, `Wireless`, or `Delivery` connection"""
+        return getattr(connection, conn_type)(
+            connection_id,
+            contents,
+            source,
+            destination,
+            tags={},
+            bidirectional=bidirectional,
+            exit_point=exit_point,
+            entry_point=entry_point,
+        )
+
+    @staticmethod
+    def _group_tags_by_contents(tags):
+        """Groups tags by their contents in a single pass
+
+        Parameters
+        ----------
+        tags : dict of Tag
+            tags of a `Node` or `Connection`, keyed by ID
+
+        Returns
+        -------
+        defaultdict
+            lists of tags keyed by `ContentsType`, in their original order.
+            Contents without any tags map to an empty list
+        """
+        tags_by_contents = defaultdict(list)
+        for tag_obj in tags.values():
+            tags_by_contents[tag_obj.contents].append(tag_obj)
+        return tags_by_contents
+
+    @staticmethod
+    def _build_virtual_total(
+        connection_obj, tags_by_contents, group_attr, source_prefix, dest_prefix
+    ):
+        """Adds virtual "total" tags to a connection if they were missing.
+        Tags are summed across the unit ID not given by `group_attr`,
+        and a separate virtual total is created for each value of `group_attr`
+
+        Parameters
+        ----------
+        connection_obj : Connection
+            connection to add the virtual "total" tags to
+
+        tags_by_contents : list of Tag
+            tags of `connection_obj` that all have the same contents
+
+        group_attr : ["dest_unit_id", "source_unit_id"]
+            `dest_unit_id` to sum across source units for each destination unit,
+            or `source_unit_id` to sum across destination units for each source unit
+
+        source_prefix : str
+            source ID of `connection_obj` followed by its exit point suffix (if any)
+
+        dest_prefix : str
+            destination ID of `connection_obj` followed by its entry point suffix
+            (if any)
+        """
+        # nothing to sum for a single tag, so skip gathering its unit IDs
+        if len(tags_by_contents) <= 1:
+            return
+
+        sum_attr = "source_unit_id" if group_attr == "dest_unit_id" else "dest_unit_id"
+        sum_unit_ids = [getattr(tag_obj, sum_attr) for tag_obj in tags_by_contents]
+        if "total" in sum_unit_ids:
+            return
+
+        operations = utils.get_tag_sum_lambda_func(sum_unit_ids)
+        first_tag = tags_by_contents[0]
+        units = first_tag.units
+        # the part of the tag ID shared by every group is only formatted once
+        type_suffix = f"{first_tag.contents.name}_{first_tag.tag_type.name}"
+        # group the tags by unit ID in one pass, preserving first-seen order
+        tags_by_group = defaultdict(list)
+        for tag_obj in tags_by_contents:
+            tags_by_group[getattr(tag_obj, group_attr)].append(tag_obj)
+        for group_id, tag_list in tags_by_group.items():
+            unit_id = "" if group_id == "total" else f"_{group_id}"
+            if group_attr == "dest_unit_id":
+                tag_id = f"{source_prefix}_{dest_prefix}{unit_id}_{type_suffix}"
+            else:
+                tag_id = f"{source_prefix}{unit_id}_{dest_prefix}_{type_suffix}"
+            v_tag = VirtualTag(tag_id, tag_list, operations=operations, units=units)
+            connection_obj.add_tag(v_tag)
+
     def parse_contents(self, id):
         """Converts a dictionary into a tuple of input and output contents
 
@@ -1244,39 +1534,33 @@ class JSONParser:
         (str, str)
             (input_contents, output_contents)
         """
-        input_contents = self.config[id].get(
-            "input_contents", self.config[id].get("contents")
-        )
+        obj_config = self.config[id]
+        contents = obj_config.get("contents")
+        input_contents = obj_config.get("input_contents", contents)
         if input_contents is None:
             raise ValueError(
                 "Either contents or input_contents must be defined for " + id
             )
-        output_contents = self.config[id].get(
-            "output_contents", self.config[id].get("contents")
-        )
+        output_contents = obj_config.get("output_contents", contents)
         if output_contents is None:
             raise ValueError(
                 "Either contents or output_contents must be defined for " + id
             )
 
         if isinstance(input_contents, list):
-            input_contents = list(
-                map(lambda contents: utils.ContentsType[contents], input_contents)
-            )
+            input_contents = [CONTENTS_MEMBERS[name] for name in input_contents]
         else:
-            input_contents = utils.ContentsType[input_contents]
+            input_contents = CONTENTS_MEMBERS[input_contents]
 
         if isinstance(output_contents, list):
-            output_contents = list(
-                map(lambda contents: utils.ContentsType[contents], output_contents)
-            )
+            output_contents = [CONTENTS_MEMBERS[name] for name in output_contents]
         else:
-            output_contents = utils.ContentsType[output_contents]
+            output_contents = CONTENTS_MEMBERS[output_contents]
 
         return (input_contents, output_contents)
 
     @staticmethod
-    def parse_virtual_tag(tag_id, tag_info, obj, parent_network=None):
+    def parse_virtual_tag(tag_id, tag_info, obj, parent_network=None, tag_index=None):
         """Parse tag ID and dictionary information into VirtualTag object
 
         Parameters
@@ -1309,15 +1593,27 @@ class JSONParser:
             If `None` will assume `obj` is the parent network
             and all tags are in `obj.tags`
 
+        tag_index : dict
+            Optional mapping of tag ID to `Tag` for every tag in `parent_network`,
+            as built by `_tag_index`. Avoids searching the network for each
+            constituent tag when parsing many virtual tags
+
         Returns
         -------
         VirtualTag
             a Python object with the given ID and the values from `tag_info`
         """
-        tag_list = []
         parent_network = obj if parent_network is None else parent_network
+        # `Connection.get_tag` does not recurse, so bind the lookup method once
+        if tag_index is not None:
+            get_tag = tag_index.get
+        elif isinstance(parent_network, connection.Connection):
+            get_tag = parent_network.tags.get
+        else:
+            get_tag = partial(parent_network.get_tag, recurse=True)
+        tag_list = []
         for subtag_id in tag_info["tags"]:
-            subtag = parent_network.get_tag(subtag_id, recurse=True)
+            subtag = get_tag(subtag_id)
             if subtag is None:
                 raise KeyError(
                     "Could not find Tag id {} in VirtualTag {}".format(
@@ -1326,14 +1622,8 @@ class JSONParser:
                 )
             tag_list.append(subtag)
         pint_unit = utils.parse_units(tag_info["units"])
-        try:
-            tag_type = TagType[tag_info["type"]]
-        except KeyError:
-            tag_type = None
-        try:
-            contents_type = utils.ContentsType[tag_info["contents"]]
-        except KeyError:
-            contents_type = None
+        tag_type = TAG_TYPE_MEMBERS.get(tag_info.get("type"))
+        contents_type = CONTENTS_MEMBERS.get(tag_info.get("contents"))
         v_tag = VirtualTag(
             tag_id,
             tag_list,
@@ -1345,6 +1635,32 @@ class JSONParser:
         )
         return v_tag
 
+    @staticmethod
+    def _tag_index(obj):
+        """Collects all tags in `obj` and its descendants into a flat dictionary.
+        Duplicate IDs resolve to the same tag as `obj.get_tag(tag_id, recurse=True)`
+
+        Parameters
+        ----------
+        obj : Node or Connection
+            object whose tags are collected
+
+        Returns
+        -------
+        dict
+            mapping of tag ID to `Tag` or `VirtualTag`
+        """
+        tag_index = {}
+        if hasattr(obj, "nodes"):
+            # earlier nodes take precedence, so they are added last
+            for node_obj in reversed(list(obj.nodes.values())):
+                tag_index.update(JSONParser._tag_index(node_obj))
+        if hasattr(obj, "connections"):
+            for connection_obj in obj.connections.values():
+                tag_index.update(connection_obj.tags)
+        tag_index.update(obj.tags)
+        return tag_index
+
     @staticmethod
     def parse_tag(tag_id, tag_info, obj):
         """Parse tag ID and dictionary of information into Tag object
@@ -1380,7 +1696,7 @@ class JSONParser:
             a Python object with the given ID and the values from `tag_info`
         """
         contents = JSONParser.get_tag_contents(tag_id, tag_info, obj)
-        tag_type = TagType[tag_info["type"]]
+        tag_type = TAG_TYPE_MEMBERS[tag_info["type"]]
         totalized = tag_info.get("totalized", False)
         pint_unit = utils.parse_units(tag_info["units"]) if tag_info["units"] else None
         source_unit_id = tag_info.get("source_unit_id", "total")
@@ -1396,10 +1712,10 @@ class JSONParser:
             if tag_info.get("report_freq")
             else None
         )
-        try:
-            downsample_method = DownsampleType[tag_info["downsample_method"]]
-        except KeyError:
-            downsample_method = None
+        # most tags omit the downsample method, so avoid raising a KeyError for each
+        downsample_method = DOWNSAMPLE_TYPE_MEMBERS.get(
+            tag_info.get("downsample_method")
+        )
         calibration_path = tag_info.get("calibration_path")
         calibration = Logbook()
         if calibration_path is not None:
@@ -1460,21 +1776,26 @@ class JSONParser:
         ------
         ValueError
             If contents are ambiguously defined in JSON.
-            E.g., contents not defined in tag and parent object has a list of contents
+            E.g., contents not defined in tag and parent object has a list of contents.
+            Also raised if the contents are not a valid `ContentsType`
         """
-        try:
-            contents = utils.ContentsType[tag_info["contents"]]
-        except KeyError:
+        contents_name = tag_info.get("contents")
+        if contents_name is None:
             contents = None
+        elif contents_name in CONTENTS_MEMBERS:
+            contents = CONTENTS_MEMBERS[contents_name]
+        else:
+            raise ValueError(f"{contents_name} is not a valid contents type")
 
-        tag_type = TagType[tag_info["type"]]
+        tag_type = TAG_TYPE_MEMBERS[tag_info["type"]]
         if contents is None and tag_type not in CONTENTLESS_TYPES:
             # will work if obj is of type Connection, otherwise exception occurs
             try:
                 contents = obj.contents
             except AttributeError:
+                # `Flaring` nodes only define `input_contents`
                 if (
-                    obj.input_contents == obj.output_contents
+                    obj.input_contents == getattr(obj, "output_contents", None)
                     and len(obj.input_contents) == 1
                 ):
                     contents = obj.input_contents[0]
@@ -1509,10 +1830,10 @@ class JSONParser:
         """
         new_dosing_dict = {}
         for k, v in dosing_dict.items():
-            if k not in utils.DosingType.__members__:
+            dosing_type = DOSING_TYPE_MEMBERS.get(k)
+            if dosing_type is None:
                 raise ValueError(f"{k} is not a valid dosing type")
-            new_v = JSONParser.parse_unit_val_dict(v)
-            new_dosing_dict[utils.DosingType[k]] = new_v
+            new_dosing_dict[dosing_type] = JSONParser.parse_unit_val_dict(v)
 
         return new_dosing_dict
 
@@ -1553,7 +1874,7 @@ class JSONParser:
         new_dosing_dict = {}
         for k, v in dosing_dict.items():
             new_v = JSONParser.unit_val_to_dict(v)
-            new_dosing_dict[k.name] = new_v
+            new_dosing_dict[k._name_] = new_v
 
         return new_dosing_dict
 
@@ -1577,32 +1898,30 @@ class JSONParser:
 
         Returns
         -------
-        (pint.Quantity, pint.Quantity, pint.Quantity) or (float, float, float)
-            (min, max, and average) with the given Pint units as a tuple.
-            If no units given, then returns a tuple of floats.
+        MinMaxDesign
+            (min, max, and design) with the given Pint units as a named tuple.
+            If no units given, then the values are floats.
         """
         if min_max_design is None:
-            return (None, None, None)
+            return MinMaxDesign(None, None, None)
         else:
-            units = min_max_design.get("units")
+            get = min_max_design.get
+            units = get("units")
 
             # field name was changed from 'avg' to 'design'
             # so this code is included for backwards compatability
-            design_val = min_max_design.get("design")
+            design_val = get("design")
             if design_val is None:
-                design_val = min_max_design.get("avg")
+                design_val = get("avg")
+            values = (get("min"), get("max"), design_val)
             if units:
-                return (
-                    utils.parse_quantity(min_max_design.get("min"), units),
-                    utils.parse_quantity(min_max_design.get("max"), units),
-                    utils.parse_quantity(design_val, units),
+                # resolve the unit string once and apply it to all three values
+                pint_units = utils.parse_units(units)
+                return MinMaxDesign._make(
+                    None if val is None else val * pint_units for val in values
                 )
             else:
-                return (
-                    min_max_design.get("min"),
-                    min_max_design.get("max"),
-                    design_val,
-                )
+                return MinMaxDesign._make(values)
 
     @staticmethod
     def unit_val_to_dict(attribute):
@@ -1624,7 +1943,10 @@ class JSONParser:
             Dictionary with keys ``value`` and ``units``
         """
         if isinstance(attribute, pint.Quantity):
-            data_dict = {"value": attribute.magnitude, "units": str(attribute.units)}
+            data_dict = {
+                "value": attribute.magnitude,
+                "units": utils.units_to_str(attribute.units),
+            }
         else:
             data_dict = {"value": attribute, "units": None}
         return data_dict
@@ -1676,21 +1998,23 @@ class JSONParser:
 
         Returns
         -------
-        (pint.Quantity, pint.Quantity) or (float, float)
-            (lower, higher) heating values as a tuple, with units applied.
-            Given as a float if no units are specified
+        HeatingValues
+            (lower, higher) heating values as a named tuple, with units applied.
+            Given as floats if no units are specified
         """
         if heating_vals is None:
-            return (None, None)
+            return HeatingValues(None, None)
         else:
-            units = heating_vals.get("units")
+            get = heating_vals.get
+            units = get("units")
+            values = (get("lower"), get("higher"))
             if units:
-                return (
-                    utils.parse_quantity(heating_vals.get("lower"), units),
-                    utils.parse_quantity(heating_vals.get("higher"), units),
+                pint_units = utils.parse_units(units)
+                return HeatingValues._make(
+                    None if val is None else val * pint_units for val in values
                 )
             else:
-                return (heating_vals.get("lower"), heating_vals.get("higher"))
+                return HeatingValues._make(values)
 
     @staticmethod
     def tag_to_dict(tag_obj):
@@ -1714,11 +2038,11 @@ class JSONParser:
         """
         tag_dict = {}
         if isinstance(tag_obj, VirtualTag):
-            tag_dict["units"] = "{!s}".format(tag_obj.units)
+            tag_dict["units"] = utils.units_to_str(tag_obj.units)
             tag_dict["tags"] = [tag.id for tag in tag_obj.tags]
             tag_dict["operations"] = tag_obj.operations
         elif isinstance(tag_obj, Tag):
-            tag_dict["units"] = "{!s}".format(tag_obj.units)
+            tag_dict["units"] = utils.units_to_str(tag_obj.units)
             tag_dict["source_unit_id"] = tag_obj.source_unit_id
             tag_dict["dest_unit_id"] = tag_obj.dest_unit_id
             tag_dict["totalized"] = tag_obj.totalized
@@ -1726,17 +2050,44 @@ class JSONParser:
             tag_dict["measure_freq"] = JSONParser.unit_val_to_dict(tag_obj.measure_freq)
             tag_dict["report_freq"] = JSONParser.unit_val_to_dict(tag_obj.report_freq)
             if tag_obj.downsample_method:
-                tag_dict["downsample_method"] = tag_obj.downsample_method.name
+                tag_dict["downsample_method"] = tag_obj.downsample_method._name_
             tag_dict["calibration"] = tag_obj.calibration.to_json()
         else:
             raise TypeError("'tag_obj' must be of type Tag or VirtualTag")
 
-        tag_dict["type"] = tag_obj.tag_type.name
+        # read the plain `_name_` attribute rather than the `name` enum property
+        tag_dict["type"] = tag_obj.tag_type._name_
         if tag_obj.tag_type not in CONTENTLESS_TYPES:
-            tag_dict["contents"] = tag_obj.contents.name
+            tag_dict["contents"] = tag_obj.contents._name_
 
         return tag_dict
 
+    @staticmethod
+    def tags_to_dicts(tags):
+        """Splits a dictionary of tags into dictionaries of converted
+        `Tag` and `VirtualTag` objects
+
+        Parameters
+        ----------
+        tags : dict of Tag or VirtualTag
+            tags of a `Node` or `Connection`, keyed by ID
+
+        Returns
+        -------
+        (dict, dict)
+            `Tag` and `VirtualTag` objects in dictionary form, keyed by ID
+        """
+        tag_dict = {}
+        v_tag_dict = {}
+        tag_to_dict = JSONParser.tag_to_dict
+        for tag_id, tag_obj in tags.items():
+            if isinstance(tag_obj, VirtualTag):
+                v_tag_dict[tag_id] = tag_to_dict(tag_obj)
+            elif isinstance(tag_obj, Tag):
+                tag_dict[tag_id] = tag_to_dict(tag_obj)
+
+        return tag_dict, v_tag_dict
+
     @staticmethod
     def min_max_design_to_dict(obj, attribute):
         """Converts the flow rate tuple of a `Node` or `Connection` into a
@@ -1764,7 +2115,7 @@ class JSONParser:
 
             }
         """
-        min_max_design_dict = {"min": None, "max": None, "design": None, "units": None}
+        min_max_design_dict = _MIN_MAX_DESIGN_TEMPLATE.copy()
         # try/except for backwards compatability with flow_rate and gen_capacity tuples
         try:
             values = getattr(obj, attribute)
@@ -1780,20 +2131,62 @@ class JSONParser:
                 getattr(obj, "max_" + suffix),
                 getattr(obj, "design_" + suffix),
             )
-        if values[0] is not None:
-            min_max_design_dict["min"] = values[0].magnitude
-            min_max_design_dict["units"] = "{!s}".format(values[0].units)
+        min_val, max_val, design_val = values
+        units = None
+        if min_val is not None:
+            min_max_design_dict["min"] = min_val.magnitude
+            units = min_val.units
 
-        if values[1] is not None:
-            min_max_design_dict["max"] = values[1].magnitude
-            min_max_design_dict["units"] = "{!s}".format(values[1].units)
+        if max_val is not None:
+            min_max_design_dict["max"] = max_val.magnitude
+            units = max_val.units
 
-        if values[2] is not None:
-            min_max_design_dict["design"] = values[2].magnitude
-            min_max_design_dict["units"] = "{!s}".format(values[2].units)
+        if design_val is not None:
+            min_max_design_dict["design"] = design_val.magnitude
+            units = design_val.units
+
+        if units is not None:
+            min_max_design_dict["units"] = utils.units_to_str(units)
 
         return min_max_design_dict
 
+    @staticmethod
+    def heating_values_to_dict(heating_values):
+        """Converts the heating values tuple of a `Pipe` into a dictionary object
+
+        Parameters
+        ----------
+        heating_values : (pint.Quantity, pint.Quantity)
+            (lower, higher) heating values
+
+        Returns
+        -------
+        dict
+            heating values in the form {
+                ``lower``: `float` or `int`
+
+                ``higher``: `float` or `int`
+
+                ``units``: `str`
+
+            }
+        """
+        heat_dict = _HEATING_VALUES_TEMPLATE.copy()
+        lower, higher = heating_values
+        units = None
+        if lower is not None:
+            heat_dict["lower"] = lower.magnitude
+            units = lower.units
+
+        if higher is not None:
+            heat_dict["higher"] = higher.magnitude
+            units = higher.units
+
+        if units is not None:
+            heat_dict["units"] = utils.units_to_str(units)
+
+        return heat_dict
+
     @staticmethod
     def conn_to_dict(conn_obj):
         """Converts a Connection object to a dictionary that can be
@@ -1809,12 +2202,12 @@ class JSONParser:
         dict
             `conn_obj` in dictionary form
         """
+        conn_type = type(conn_obj)
         conn_dict = {}
-        print(conn_obj)
-        conn_dict["type"] = type(conn_obj).__name__
+        conn_dict["type"] = conn_type.__name__
         conn_dict["source"] = conn_obj.source.id
         conn_dict["destination"] = conn_obj.destination.id
-        conn_dict["contents"] = conn_obj.contents.name
+        conn_dict["contents"] = conn_obj.contents._name_
         conn_dict["bidirectional"] = conn_obj.bidirectional
 
         if conn_obj.exit_point is not None:
@@ -1823,43 +2216,61 @@ class JSONParser:
         if conn_obj.entry_point is not None:
             conn_dict["entry_point"] = conn_obj.entry_point.id
 
-        if isinstance(conn_obj, connection.Pipe):
-            conn_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                conn_obj, "flow_rate"
-            )
-            conn_dict["pressure"] = JSONParser.min_max_design_to_dict(
-                conn_obj, "pressure"
-            )
+        serializer = JSONParser._lookup_serializer(_CONNECTION_SERIALIZERS, conn_type)
+        serializer(conn_obj, conn_dict)
+
+        conn_dict["tags"], conn_dict["virtual_tags"] = JSONParser.tags_to_dicts(
+            conn_obj.tags
+        )
+
+        return conn_dict
+
+    @staticmethod
+    def _lookup_serializer(serializers, obj_type):
+        """Finds the serializer registered for `obj_type` or its closest parent
+        class. Subclasses are resolved through their MRO once and memoized
 
-            heat_dict = {"lower": None, "higher": None, "units": "BTU/scf"}
-            if conn_obj.heating_values[0] is not None:
-                heat_dict["lower"] = conn_obj.heating_values[0].magnitude
-                heat_dict["units"] = "{!s}".format(conn_obj.heating_values[0].units)
+        Parameters
+        ----------
+        serializers : dict
+            class to serializer function mapping, updated in place
 
-            if conn_obj.heating_values[1] is not None:
-                heat_dict["higher"] = conn_obj.heating_values[1].magnitude
-                heat_dict["units"] = "{!s}".format(conn_obj.heating_values[1].units)
+        obj_type : type
+            class of the object to serialize
 
-            conn_dict["heating_values"] = heat_dict
+        Returns
+        -------
+        function or None
+            serializer for `obj_type`, or None if there is no registered parent class
+        """
+        serializer = serializers.get(obj_type)
+        if serializer is None:
+            for cls in obj_type.__mro__[1:]:
+                serializer = serializers.get(cls)
+                if serializer is not None:
+                    serializers[obj_type] = serializer
+                    break
+        return serializer
 
-            if conn_obj.diameter is not None:
-                conn_dict["diameter"] = JSONParser.unit_val_to_dict(conn_obj.diameter)
+    @staticmethod
+    def _pipe_to_dict(conn_obj, conn_dict):
+        """Adds the attributes of a `Pipe` to `conn_dict`"""
+        conn_dict["flowrate"] = JSONParser.min_max_design_to_dict(conn_obj, "flow_rate")
+        conn_dict["pressure"] = JSONParser.min_max_design_to_dict(conn_obj, "pressure")
 
-            if conn_obj.friction_coeff is not None:
-                conn_dict["friction_coeff"] = conn_obj.friction_coeff
+        conn_dict["heating_values"] = JSONParser.heating_values_to_dict(
+            conn_obj.heating_values
+        )
 
-        tag_dict = {}
-        v_tag_dict = {}
-        for tag_id, tag_obj in conn_obj.tags.items():
-            if isinstance(tag_obj, Tag):
-                tag_dict[tag_id] = JSONParser.tag_to_dict(tag_obj)
-            elif isinstance(tag_obj, VirtualTag):
-                v_tag_dict[tag_id] = JSONParser.tag_to_dict(tag_obj)
+        if conn_obj.diameter is not None:
+            conn_dict["diameter"] = JSONParser.unit_val_to_dict(conn_obj.diameter)
 
-        conn_dict["tags"] = tag_dict
-        conn_dict["virtual_tags"] = v_tag_dict
+        if conn_obj.friction_coeff is not None:
+            conn_dict["friction_coeff"] = conn_obj.friction_coeff
 
-        return conn_dict
+    @staticmethod
+    def _connection_attrs_to_dict(conn_obj, conn_dict):
+        """Other `Connection` types have no attributes beyond the common ones"""
 
     @staticmethod
     def node_to_dict(node_obj):
@@ -1881,191 +2292,191 @@ class JSONParser:
         dict
             `node_obj` in dictionary form
         """
+        node_type = type(node_obj)
+        serializer = JSONParser._lookup_serializer(_NODE_SERIALIZERS, node_type)
+        if serializer is None:
+            raise TypeError("Unsupported Node type: " + node_type.__name__)
+
         node_dict = {}
 
-        node_dict["type"] = type(node_obj).__name__
+        node_dict["type"] = node_type.__name__
         if not isinstance(node_obj, node.Flaring):
             node_dict["input_contents"] = [
-                contents.name for contents in node_obj.input_contents
+                contents._name_ for contents in node_obj.input_contents
             ]
             node_dict["output_contents"] = [
-                contents.name for contents in node_obj.output_contents
+                contents._name_ for contents in node_obj.output_contents
             ]
         else:
             node_dict["contents"] = [
-                contents.name for contents in node_obj.input_contents
+                contents._name_ for contents in node_obj.input_contents
             ]
 
-        tag_dict = {}
-        v_tag_dict = {}
-        for tag_id, tag_obj in node_obj.tags.items():
-            if isinstance(tag_obj, Tag):
-                tag_dict[tag_id] = JSONParser.tag_to_dict(tag_obj)
-            elif isinstance(tag_obj, VirtualTag):
-                v_tag_dict[tag_id] = JSONParser.tag_to_dict(tag_obj)
-
-        node_dict["tags"] = tag_dict
-        node_dict["virtual_tags"] = v_tag_dict
-
-        if isinstance(node_obj, node.Reservoir):
-            if node_obj.elevation is not None:
-                node_dict["elevation"] = JSONParser.unit_val_to_dict(node_obj.elevation)
-
-            if node_obj.volume is not None:
-                node_dict["volume (cubic meters)"] = node_obj.volume.magnitude
-        elif isinstance(node_obj, node.Tank):
-            if node_obj.elevation is not None:
-                node_dict["elevation (meters)"] = node_obj.elevation.magnitude
-
-            if node_obj.volume is not None:
-                node_dict["volume (cubic meters)"] = node_obj.volume.magnitude
-            if node_obj.num_units is not None:
-                node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, node.Pump):
-            if node_obj.elevation is not None:
-                node_dict["elevation"] = JSONParser.unit_val_to_dict(node_obj.elevation)
-
-            if node_obj.power_rating is not None:
-                node_dict["power_rating"] = JSONParser.unit_val_to_dict(
-                    node_obj.power_rating
-                )
+        node_dict["tags"], node_dict["virtual_tags"] = JSONParser.tags_to_dicts(
+            node_obj.tags
+        )
 
-            if node_obj.pump_type is not None:
-                node_dict["pump_type"] = node_obj.pump_type.name
+        serializer(node_obj, node_dict)
+        return node_dict
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, node.Digestion):
-            if node_obj.volume is not None:
-                node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+    @staticmethod
+    def _reservoir_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Reservoir` to `node_dict`"""
+        if node_obj.elevation is not None:
+            node_dict["elevation"] = JSONParser.unit_val_to_dict(node_obj.elevation)
 
-            if node_obj.digester_type is not None:
-                node_dict["digester_type"] = node_obj.digester_type.name
+        if node_obj.volume is not None:
+            node_dict["volume (cubic meters)"] = node_obj.volume.magnitude
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, (node.Cogeneration, node.Boiler)):
-            node_dict["generation_capacity"] = JSONParser.min_max_design_to_dict(
-                node_obj, "gen_capacity"
-            )
+    @staticmethod
+    def _tank_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Tank` to `node_dict`"""
+        if node_obj.elevation is not None:
+            node_dict["elevation (meters)"] = node_obj.elevation.magnitude
+
+        if node_obj.volume is not None:
+            node_dict["volume (cubic meters)"] = node_obj.volume.magnitude
+        if node_obj.num_units is not None:
             node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, node.Disinfection):
-            if node_obj.volume is not None:
-                node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-            node_dict["residence_time"] = JSONParser.unit_val_to_dict(
-                node_obj.residence_time
-            )
-            if isinstance(node_obj, node.UVSystem):
-                node_dict["area"] = JSONParser.unit_val_to_dict(
-                    node_obj.dosing_area[utils.DosingType["UVLight"]]
-                )
-                node_dict["intensity"] = JSONParser.unit_val_to_dict(
-                    node_obj.dosing_rate[utils.DosingType["UVLight"]]
-                )
-            else:
-                node_dict["dosing_rate"] = JSONParser.dosing_to_dict(
-                    node_obj.dosing_rate
-                )
-        elif isinstance(node_obj, node.Filtration):
-            if node_obj.volume is not None:
-                node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+    @staticmethod
+    def _pump_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Pump` to `node_dict`"""
+        if node_obj.elevation is not None:
+            node_dict["elevation"] = JSONParser.unit_val_to_dict(node_obj.elevation)
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-            node_dict["settling_time"] = JSONParser.unit_val_to_dict(
-                node_obj.settling_time
+        if node_obj.power_rating is not None:
+            node_dict["power_rating"] = JSONParser.unit_val_to_dict(
+                node_obj.power_rating
             )
-            node_dict["dosing_rate"] = JSONParser.dosing_to_dict(node_obj.dosing_rate)
 
-            if isinstance(node_obj, node.ROMembrane):
-                node_dict["area"] = JSONParser.unit_val_to_dict(node_obj.area)
-                node_dict["selectivity"] = JSONParser.unit_val_to_dict(
-                    node_obj.selectivity
-                )
-                node_dict["permeability"] = JSONParser.unit_val_to_dict(
-                    node_obj.permeability
-                )
-        elif isinstance(node_obj, (node.Reactor, node.StaticMixer)):
-            if node_obj.volume is not None:
-                node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+        if node_obj.pump_type is not None:
+            node_dict["pump_type"] = node_obj.pump_type._name_
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+
+    @staticmethod
+    def _digestion_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Digestion` node to `node_dict`"""
+        if node_obj.volume is not None:
+            node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+
+        if node_obj.digester_type is not None:
+            node_dict["digester_type"] = node_obj.digester_type._name_
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+
+    @staticmethod
+    def _generator_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Cogeneration` or `Boiler` node to `node_dict`"""
+        node_dict["generation_capacity"] = JSONParser.min_max_design_to_dict(
+            node_obj, "gen_capacity"
+        )
+        node_dict["num_units"] = node_obj.num_units
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
+    @staticmethod
+    def _disinfection_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Disinfection` node to `node_dict`"""
+        if node_obj.volume is not None:
+            node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+        node_dict["residence_time"] = JSONParser.unit_val_to_dict(
+            node_obj.residence_time
+        )
+        if isinstance(node_obj, node.UVSystem):
+            node_dict["area"] = JSONParser.unit_val_to_dict(
+                node_obj.dosing_area[utils.DosingType.UVLight]
             )
-            node_dict["num_units"] = node_obj.num_units
-            node_dict["residence_time"] = JSONParser.unit_val_to_dict(
-                node_obj.residence_time
+            node_dict["intensity"] = JSONParser.unit_val_to_dict(
+                node_obj.dosing_rate[utils.DosingType.UVLight]
             )
+        else:
             node_dict["dosing_rate"] = JSONParser.dosing_to_dict(node_obj.dosing_rate)
-            node_dict["pH"] = node_obj.pH
-        elif isinstance(node_obj, (node.Thickening, node.Aeration, node.Clarification)):
-            if node_obj.volume is not None:
-                node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
 
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, (node.Screening, node.Conditioning, node.Flaring)):
-            node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                node_obj, "flow_rate"
-            )
-            node_dict["num_units"] = node_obj.num_units
-        elif isinstance(node_obj, node.Battery):
-            node_dict["energy_capacity"] = JSONParser.unit_val_to_dict(
-                node_obj.energy_capacity
-            )
-            node_dict["discharge_rate"] = JSONParser.unit_val_to_dict(
-                node_obj.discharge_rate
+    @staticmethod
+    def _filtration_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Filtration` node to `node_dict`"""
+        if node_obj.volume is not None:
+            node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+        node_dict["settling_time"] = JSONParser.unit_val_to_dict(node_obj.settling_time)
+        node_dict["dosing_rate"] = JSONParser.dosing_to_dict(node_obj.dosing_rate)
+
+        if isinstance(node_obj, node.ROMembrane):
+            node_dict["area"] = JSONParser.unit_val_to_dict(node_obj.area)
+            node_dict["selectivity"] = JSONParser.unit_val_to_dict(node_obj.selectivity)
+            node_dict["permeability"] = JSONParser.unit_val_to_dict(
+                node_obj.permeability
             )
-            node_dict["charge_rate"] = JSONParser.unit_val_to_dict(node_obj.charge_rate)
-            node_dict["leakage"] = JSONParser.unit_val_to_dict(node_obj.leakage)
-            node_dict["rte"] = node_obj.rte
-        elif isinstance(node_obj, node.Network):
-            node_dict["type"] = type(node_obj).__name__
-            node_dict["input_contents"] = [
-                contents.name for contents in node_obj.input_contents
-            ]
-            node_dict["output_contents"] = [
-                contents.name for contents in node_obj.output_contents
-            ]
-            node_dict["nodes"] = []
-            node_dict["connections"] = []
-            for subnode in node_obj.get_all_nodes(recurse=False):
-                node_dict["nodes"].append(subnode.id)
-            for conn in node_obj.get_all_connections(recurse=False):
-                node_dict["connections"].append(conn.id)
-            if isinstance(node_obj, node.Facility):
-                if node_obj.elevation is not None:
-                    node_dict["elevation"] = JSONParser.unit_val_to_dict(
-                        node_obj.elevation
-                    )
 
-                node_dict["flowrate"] = JSONParser.min_max_design_to_dict(
-                    node_obj, "flow_rate"
-                )
-        elif isinstance(node_obj, node.Joint):
-            node_dict["type"] = type(node_obj).__name__
-            node_dict["input_contents"] = [
-                contents.name for contents in node_obj.input_contents
-            ]
-            node_dict["output_contents"] = [
-                contents.name for contents in node_obj.output_contents
-            ]
-        else:
-            raise TypeError("Unsupported Node type: " + type(node_obj).__name__)
-        return node_dict
+    @staticmethod
+    def _reactor_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Reactor` or `StaticMixer` to `node_dict`"""
+        if node_obj.volume is not None:
+            node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+        node_dict["residence_time"] = JSONParser.unit_val_to_dict(
+            node_obj.residence_time
+        )
+        node_dict["dosing_rate"] = JSONParser.dosing_to_dict(node_obj.dosing_rate)
+        node_dict["pH"] = node_obj.pH
+
+    @staticmethod
+    def _vessel_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Thickening`, `Aeration`, or `Clarification`
+        node to `node_dict`"""
+        if node_obj.volume is not None:
+            node_dict["volume"] = JSONParser.unit_val_to_dict(node_obj.volume)
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+
+    @staticmethod
+    def _flow_unit_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Screening`, `Conditioning`, or `Flaring`
+        node to `node_dict`"""
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+        node_dict["num_units"] = node_obj.num_units
+
+    @staticmethod
+    def _battery_to_dict(node_obj, node_dict):
+        """Adds the attributes of a `Battery` to `node_dict`"""
+        node_dict["energy_capacity"] = JSONParser.unit_val_to_dict(
+            node_obj.energy_capacity
+        )
+        node_dict["discharge_rate"] = JSONParser.unit_val_to_dict(
+            node_obj.discharge_rate
+        )
+        node_dict["charge_rate"] = JSONParser.unit_val_to_dict(node_obj.charge_rate)
+        node_dict["leakage"] = JSONParser.unit_val_to_dict(node_obj.leakage)
+        node_dict["rte"] = node_obj.rte
+
+    @staticmethod
+    def _network_to_dict(node_obj, node_dict):
+        """Adds the children of a `Network` to `node_dict`"""
+        node_dict["nodes"] = list(node_obj.nodes.keys())
+        node_dict["connections"] = list(node_obj.connections.keys())
+
+    @staticmethod
+    def _facility_to_dict(node_obj, node_dict):
+        """Adds the children and attributes of a `Facility` to `node_dict`"""
+        JSONParser._network_to_dict(node_obj, node_dict)
+        if node_obj.elevation is not None:
+            node_dict["elevation"] = JSONParser.unit_val_to_dict(node_obj.elevation)
+
+        node_dict["flowrate"] = JSONParser.min_max_design_to_dict(node_obj, "flow_rate")
+
+    @staticmethod
+    def _joint_to_dict(node_obj, node_dict):
+        """A `Joint` has no attributes beyond those common to every `Node`"""
 
     @staticmethod
     def to_json(network, file_path=None, indent=4, verbose=False):
@@ -2081,7 +2492,10 @@ class JSONParser:
             Default is None, meaning that no file will be written
 
         indent : int
-            number of spaces to indent the JSON file. Default is 4
+            number of spaces to indent the JSON file. Default is 4.
+            If the optional `orjson` package is installed, it is used to write
+            the file faster when `indent` is 2 or None, unless the network
+            contains infinite or NaN values, which orjson cannot represent
 
         verbose : bool
             Whether to print informative messages for debugging. Default is False
@@ -2099,7 +2513,11 @@ class JSONParser:
         if not isinstance(network, node.Network):
             raise TypeError("Only Network objects can be converted to JSON format")
 
-        result = {"nodes": [], "connections": [], "virtual_tags": {}}
+        result = {
+            "nodes": list(network.nodes.keys()),
+            "connections": list(network.connections.keys()),
+            "virtual_tags": {},
+        }
 
         for tag_id, tag_obj in network.tags.items():
             if isinstance(tag_obj, VirtualTag):
@@ -2110,30 +2528,172 @@ class JSONParser:
                 v_tag_dict = JSONParser.tag_to_dict(tag_obj)
                 result["virtual_tags"][tag_id] = v_tag_dict
 
-        for conn_obj in network.get_all_connections(recurse=False):
-            result["connections"].append(conn_obj.id)
+        # walk the hierarchy once, keeping connections ahead of nodes in the output
+        conn_dicts = {}
+        node_dicts = {}
+        JSONParser._children_to_dict(network, conn_dicts, node_dicts, verbose=verbose)
+        result.update(conn_dicts)
+        result.update(node_dicts)
 
-        for conn_obj in network.get_all_connections(recurse=True):
-            if verbose:
-                print(
-                    f"Outputting json file, converting {conn_obj.id} to a dictionary..."
-                )
-            conn_dict = JSONParser.conn_to_dict(conn_obj)
-            result[conn_obj.id] = conn_dict
+        if file_path is not None:
+            # orjson only supports two-space indentation and writes
+            # non-finite floats as null, so fall back to `json` for those
+            serialized = None
+            if (
+                orjson is not None
+                and indent in (None, 2)
+                and JSONParser._all_finite(result)
+            ):
+                option = orjson.OPT_NON_STR_KEYS
+                if indent:
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    serialized = orjson.dumps(result, option=option)
+                except orjson.JSONEncodeError:
+                    # let `json` accept or reject types orjson does not handle
+                    # natively (e.g., numpy scalars) so both writers agree
+                    pass
+
+            if serialized is not None:
+                with open(file_path, "wb") as file:
+                    file.write(serialized)
+            else:
+                # compact separators unless the output is meant to be pretty-printed
+                separators = (",", ":") if indent is None else None
+                with open(file_path, "w", encoding="utf-8") as file:
+                    json.dump(
+                        result,
+                        file,
+                        indent=indent,
+                        separators=separators,
+                        ensure_ascii=False,
+                    )
+
+        return result
+
+    @staticmethod
+    def _all_finite(obj):
+        """Checks that a JSON-compatible object contains no infinite or NaN floats
+
+        Parameters
+        ----------
+        obj : dict, list, tuple, or scalar
+            object to check, including any nested containers
+
+        Returns
+        -------
+        bool
+            False if any float in `obj` is infinite or NaN, True otherwise
+        """
+        if isinstance(obj, dict):
+            return all(JSONParser._all_finite(value) for value in obj.values())
+        elif isinstance(obj, (list, tuple)):
+            return all(JSONParser._all_finite(value) for value in obj)
+        elif isinstance(obj, float):
+            return math.isfinite(obj)
+        return True
 
-        for node_obj in network.get_all_nodes(recurse=False):
-            result["nodes"].append(node_obj.id)
+    @staticmethod
+    def _children_to_dict(network, conn_dicts, node_dicts, verbose=False):
+        """Recursively converts the connections and nodes inside `network` to
+        dictionaries, in the same order as `get_all_connections(recurse=True)`
+        and `get_all_nodes(recurse=True)`
+
+        Parameters
+        ----------
+        network : node.Network
+            Network object whose children are converted
+
+        conn_dicts : dict
+            connection ID to dictionary mapping, updated in place
+
+        node_dicts : dict
+            node ID to dictionary mapping, updated in place
+
+        verbose : bool
+            Whether to print informative messages for debugging. Default is False
+        """
+        for conn_id, conn_obj in network.connections.items():
+            if verbose:
+                print(f"Outputting json file, converting {conn_id} to a dictionary...")
+            conn_dicts[conn_id] = JSONParser.conn_to_dict(conn_obj)
 
-        for node_obj in network.get_all_nodes(recurse=True):
+        for node_id, node_obj in network.nodes.items():
             if verbose:
-                print(
-                    f"Outputting json file, converting {node_obj.id} to a dictionary..."
+                print(f"Outputting json file, converting {node_id} to a dictionary...")
+            node_dicts[node_id] = JSONParser.node_to_dict(node_obj)
+
+        for node_obj in network.nodes.values():
+            if isinstance(node_obj, node.Network):
+                JSONParser._children_to_dict(
+                    node_obj, conn_dicts, node_dicts, verbose=verbose
                 )
-            node_dict = JSONParser.node_to_dict(node_obj)
-            result[node_obj.id] = node_dict
 
-        if file_path is not None:
-            with open(file_path, "w") as file:
-                json.dump(result, file, indent=indent)
 
-        return result
+# maps each `Node` class to the `JSONParser` method that adds its attributes
+# in `node_to_dict`. Subclasses not listed are resolved through their MRO
+_NODE_SERIALIZERS = {
+    node.Reservoir: JSONParser._reservoir_to_dict,
+    node.Tank: JSONParser._tank_to_dict,
+    node.Pump: JSONParser._pump_to_dict,
+    node.Digestion: JSONParser._digestion_to_dict,
+    node.Cogeneration: JSONParser._generator_to_dict,
+    node.Boiler: JSONParser._generator_to_dict,
+    node.Disinfection: JSONParser._disinfection_to_dict,
+    node.Filtration: JSONParser._filtration_to_dict,
+    node.Reactor: JSONParser._reactor_to_dict,
+    node.Thickening: JSONParser._vessel_to_dict,
+    node.Aeration: JSONParser._vessel_to_dict,
+    node.Clarification: JSONParser._vessel_to_dict,
+    node.Screening: JSONParser._flow_unit_to_dict,
+    node.Conditioning: JSONParser._flow_unit_to_dict,
+    node.Flaring: JSONParser._flow_unit_to_dict,
+    node.Battery: JSONParser._battery_to_dict,
+    node.Network: JSONParser._network_to_dict,
+    node.Facility: JSONParser._facility_to_dict,
+    node.ModularUnit: JSONParser._network_to_dict,
+    node.Joint: JSONParser._joint_to_dict,
+}
+
+# same as `_NODE_SERIALIZERS`, but for `conn_to_dict`
+_CONNECTION_SERIALIZERS = {
+    connection.Pipe: JSONParser._pipe_to_dict,
+    connection.Connection: JSONParser._connection_attrs_to_dict,
+}
+
+# maps the "type" of a node in the JSON configuration to the `JSONParser` method
+# that creates it in `create_node`
+_NODE_BUILDERS = {
+    "Network": JSONParser._create_network,
+    "Facility": JSONParser._create_network,
+    "ModularUnit": JSONParser._create_network,
+    "Battery": JSONParser._create_battery,
+    "Pump": JSONParser._create_pump,
+    "Reservoir": JSONParser._create_reservoir,
+    "Tank": JSONParser._create_tank,
+    "Aeration": JSONParser._create_vessel,
+    "Clarification": JSONParser._create_vessel,
+    "Thickening": JSONParser._create_vessel,
+    "Cogeneration": JSONParser._create_generator,
+    "Boiler": JSONParser._create_generator,
+    "Digestion": JSONParser._create_digestion,
+    "Filtration": JSONParser._create_filtration,
+    "ROMembrane": JSONParser._create_ro_membrane,
+    "Chlorination": JSONParser._create_disinfection,
+    "Disinfection": JSONParser._create_disinfection,
+    "UVSystem": JSONParser._create_uv_system,
+    "Flaring": JSONParser._create_flaring,
+    "Screening": JSONParser._create_flow_unit,
+    "Conditioning": JSONParser._create_flow_unit,
+    "Reactor": JSONParser._create_reactor,
+    "StaticMixer": JSONParser._create_reactor,
+    "Joint": JSONParser._create_joint,
+}
+
+# same as `_NODE_BUILDERS`, but for `create_connection`
+_CONNECTION_BUILDERS = {
+    "Pipe": JSONParser._create_pipe,
+    "Wire": JSONParser._create_link,
+    "Wireless": JSONParser._create_link,
+    "Delivery": JSONParser._create_link,
+}
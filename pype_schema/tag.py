@@ -1,10 +1,11 @@
 import warnings
 from enum import Enum, auto
+from functools import lru_cache
 from pandas import DataFrame, Series
 import pandas as pd  # noqa: F401
 import numpy as np  # noqa: F401
 import scipy as sp  # noqa: F401
-from numpy import ndarray, issubdtype
+from numpy import ndarray
 from .utils import count_args
 from .units import u
 from .operations import *  # noqa: F401, F403
@@ -49,14 +50,36 @@ class DownsampleType(Enum):
     Reservoir = auto()
 
 
-CONTENTLESS_TYPES = [
-    TagType.RunTime,
-    TagType.RunStatus,
-    TagType.Rotation,
-    TagType.Efficiency,
-    TagType.Speed,
-    TagType.Frequency,
-]
+CONTENTLESS_TYPES = frozenset(
+    [
+        TagType.RunTime,
+        TagType.RunStatus,
+        TagType.Rotation,
+        TagType.Efficiency,
+        TagType.Speed,
+        TagType.Frequency,
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def compile_operations(operations):
+    """Convert a lambda function string into a function.
+    Results are cached since many virtual tags share the same operations string
+    (e.g., the sums from `utils.get_tag_sum_lambda_func`)
+
+    Parameters
+    ----------
+    operations : str
+        A string representation of a lambda function
+
+    Returns
+    -------
+    function
+        The lambda function, evaluated with access to this module's imports
+        (e.g., `np`, `pd`, and `sp`)
+    """
+    return eval(operations)
 
 
 class Tag:
@@ -151,6 +174,22 @@ class Tag:
         A history of sensor calibration.
     """
 
+    __slots__ = (
+        "id",
+        "units",
+        "contents",
+        "tag_type",
+        "totalized",
+        "source_unit_id",
+        "dest_unit_id",
+        "parent_id",
+        "_manufacturer",
+        "_measure_freq",
+        "_report_freq",
+        "_downsample_method",
+        "_calibration",
+    )
+
     def __init__(
         self,
         id,
@@ -165,7 +204,7 @@ class Tag:
         measure_freq=None,
         report_freq=None,
         downsample_method=None,
-        calibration=Logbook(),
+        calibration=None,
     ):
         self.id = id
         self.units = units
@@ -186,7 +225,15 @@ class Tag:
         else:
             self.report_freq = report_freq
         self.downsample_method = downsample_method
-        self.calibration = calibration
+        self.calibration = Logbook() if calibration is None else calibration
+
+    def __setstate__(self, state):
+        # objects pickled before `__slots__` was introduced store a `__dict__`,
+        # whereas newer ones store a `(None, slots)` tuple
+        if isinstance(state, tuple):
+            state = state[1]
+        for attr, value in state.items():
+            setattr(self, attr, value)
 
     def __repr__(self):
         return (
@@ -446,6 +493,17 @@ class VirtualTag:
         Contents moving through the node
     """
 
+    __slots__ = (
+        "id",
+        "parent_id",
+        "tags",
+        "units",
+        "contents",
+        "tag_type",
+        "totalized",
+        "operations",
+    )
+
     def __init__(
         self,
         id,
@@ -463,14 +521,12 @@ class VirtualTag:
         self.tags = tags
         self.units = units
 
-        units = []
         totalized = None
 
         determine_type = True if tag_type is None else False
         determine_contents = True if contents is None else False
         totalized_mix = False
         for tag in tags:
-            units.append(tag.units)
             if totalized is not None and not totalized_mix:
                 if totalized != tag.totalized:
                     warnings.warn(
@@ -508,7 +564,7 @@ class VirtualTag:
         self.tag_type = tag_type
         self.totalized = totalized
 
-        if operations is not None and operations:
+        if operations:
             if count_args(operations) != len(tags):
                 raise ValueError(
                     "Operations lambda function must have the same "
@@ -522,6 +578,14 @@ class VirtualTag:
 
         self.operations = operations
 
+    def __setstate__(self, state):
+        # objects pickled before `__slots__` was introduced store a `__dict__`,
+        # whereas newer ones store a `(None, slots)` tuple
+        if isinstance(state, tuple):
+            state = state[1]
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def __repr__(self):
         return (
             f"<pype_schema.tag.VirtualTag id:{self.id} units:{self.units} "
@@ -600,47 +664,38 @@ class VirtualTag:
         list, array, or Series
             numpy array of combined dataset
         """
-        result = data.copy()
-        num_ops = count_args(self.operations)
-        func_ = eval(self.operations)
-        if isinstance(data, list):
-            if num_ops == len(data):
-                result = func_(*[data_ for data_ in data])
-            else:
-                raise ValueError(
-                    "Data must have the correct dimensions "
-                    "(same length as unary operations). "
-                    "Currently there are {} unary operations and {} data tags".format(
-                        num_ops, len(data)
-                    )
-                )
-        elif isinstance(data, ndarray):
-            if issubdtype(data.dtype, (int)):
-                result = result.astype("float")
-            if num_ops == data.shape[1]:
-                result = func_(*[data[:, i] for i in range(data.shape[1])])
-            else:
-                raise ValueError(
-                    "Data must have the correct dimensions "
-                    "(same length as number of args in operations lambda function). "
-                    "Currently there are {} args and {} data tags".format(
-                        num_ops, data.shape[1]
-                    )
-                )
+        if isinstance(data, ndarray):
+            args = [data[:, i] for i in range(data.shape[1])]
+        elif isinstance(data, list):
+            args = data
         elif isinstance(data, (dict, DataFrame)):
-            varnames = []
+            args = []
             for tag_obj in self.tags:
-                varname = tag_to_var_map[tag_obj.id] if tag_to_var_map else tag_obj.id
-                varnames.append(varname)
                 if isinstance(tag_obj, self.__class__):
-                    data[varname] = tag_obj.calculate_values(data)
-            result = func_(*[data[varname] for varname in varnames])
-            if isinstance(result, Series):
-                result.rename(self.id, inplace=True)
-
+                    # pass nested values directly instead of inserting a column
+                    # into (and thereby copying or fragmenting) the caller's data
+                    args.append(tag_obj.calculate_values(data))
+                elif tag_to_var_map:
+                    args.append(data[tag_to_var_map[tag_obj.id]])
+                else:
+                    args.append(data[tag_obj.id])
         else:
             raise TypeError("Data must be either a list, array, dict, or DataFrame")
 
+        num_ops = count_args(self.operations)
+        if num_ops != len(args):
+            raise ValueError(
+                "Data must have the correct dimensions "
+                "(same length as number of args in operations lambda function). "
+                "Currently there are {} args and {} data tags".format(
+                    num_ops, len(args)
+                )
+            )
+
+        result = compile_operations(self.operations)(*args)
+        if isinstance(result, Series):
+            result.rename(self.id, inplace=True)
+
         return result
 
     def calculate_values(self, data, tag_to_var_map={}):
@@ -662,13 +717,13 @@ class VirtualTag:
         list, array, or Series
             numpy array of combined dataset
         """
-        if self.operations is not None and self.operations:
+        if self.operations:
             data = self.process_ops(data, tag_to_var_map=tag_to_var_map)
-        elif isinstance(data, (dict, DataFrame)):
-            # if ops, get appropriate column and rename
-            data = data[self.tags[0].id].rename(self.id)
         elif isinstance(data, ndarray):
             # flatten array since operations do that automatically
             data = data[:, 0]
+        elif isinstance(data, (dict, DataFrame)):
+            # if ops, get appropriate column and rename
+            data = data[self.tags[0].id].rename(self.id)
 
         return data
@@ -1112,6 +1112,7 @@ def test_depr_flow_rate(node, flow_rate):
     assert node.min_flow == flow_rate[0]
     assert node.max_flow == flow_rate[1]
     assert node.design_flow == flow_rate[2]
+    assert node.flow_rate.design == flow_rate[2]
 
     # delete gen_capacity one-by-one, checking AttributeError
     node.del_min_flow()
@@ -1166,3 +1167,21 @@ def test_depr_flow_rate(node, flow_rate):
 )
 def test_unequal_different_types(obj1, obj2):
     assert obj1 != obj2
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "node_cls, args",
+    [
+        (ModularUnit, ([ContentsType.PretreatedWater], [ContentsType.Brine], 1)),
+        (Cogeneration, ([ContentsType.Biogas], None, None, None, 1)),
+    ],
+)
+def test_default_containers_not_shared(node_cls, args):
+    node1 = node_cls("Node1", *args)
+    node2 = node_cls("Node2", *args)
+    node1.add_tag(Tag("Tag1", None, TagType.Flow, "total", None, "Node1"))
+    assert "Tag1" not in node2.tags
+    if hasattr(node1, "nodes"):
+        assert node1.nodes is not node2.nodes
+        assert node1.connections is not node2.connections
@@ -2,7 +2,9 @@ import os
 import pint
 import pytest
 import pickle
+import numpy as np
 from pype_schema.units import u
+from pype_schema import utils
 from pype_schema.parse_json import JSONParser
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
@@ -98,6 +100,42 @@ def test_to_json(json_path):
     assert result == expected
 
 
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, indent, elevation, expected_error",
+    [
+        ("../data/wrrf_sample.json", None, None, None),
+        ("../data/wrrf_sample.json", 2, None, None),
+        ("../data/desal_sample.json", 2, None, None),
+        ("../data/wrrf_sample.json", None, float("inf"), None),
+        ("../data/desal_sample.json", 2, float("-inf"), None),
+        ("../data/desal_sample.json", 4, float("inf"), None),
+        ("../data/desal_sample.json", 2, np.float64(12.5), None),
+        ("../data/desal_sample.json", 2, np.float64("inf"), None),
+        ("../data/desal_sample.json", 4, np.float64("inf"), None),
+        ("../data/desal_sample.json", 2, np.float32("inf"), "TypeError"),
+        ("../data/desal_sample.json", None, np.float32(1.5), "TypeError"),
+        ("../data/desal_sample.json", 4, np.float32("inf"), "TypeError"),
+    ],
+)
+def test_to_json_indent(json_path, indent, elevation, expected_error):
+    expected = JSONParser(json_path).initialize_network()
+    if elevation is not None:
+        expected.nodes["DesalPlant"].elevation = elevation * u.m
+    try:
+        JSONParser.to_json(expected, "data/test_to_json.json", indent=indent)
+    except Exception as err:
+        assert type(err).__name__ == expected_error
+        return
+
+    assert expected_error is None
+    if elevation is not None and not np.isfinite(elevation):
+        with open("data/test_to_json.json", "r") as file:
+            assert "Infinity" in file.read()
+    result = JSONParser("data/test_to_json.json").initialize_network()
+    assert result == expected
+
+
 @pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
 @pytest.mark.parametrize(
     "unextend_json, extension, target_node_id, conn_path, extend_json",
@@ -117,3 +155,252 @@ def test_extend_node(unextend_json, extension, target_node_id, conn_path, extend
     result = parser.extend_node(extension, target_node_id, conn_path, verbose=True)
     expected = JSONParser(extend_json).initialize_network()
     assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, obj_id, subtag_ids, expected",
+    [
+        (
+            "../data/wrrf_sample.json",
+            "ConditionerToCogen",
+            ["Digester1GasFlow", "Digester2GasFlow"],
+            ["Digester1GasFlow", "Digester2GasFlow"],
+        ),
+        ("../data/wrrf_sample.json", "ConditionerToCogen", ["Missing"], "KeyError"),
+    ],
+)
+def test_parse_virtual_tag_connection(json_path, obj_id, subtag_ids, expected):
+    network = JSONParser(json_path).initialize_network()
+    conn_obj = network.get_connection(obj_id, recurse=True)
+    tag_info = {
+        "tags": subtag_ids,
+        "operations": "lambda " + ",".join(subtag_ids) + ": " + "+".join(subtag_ids),
+        "units": "SCFM",
+        "type": "Flow",
+        "contents": "Biogas",
+    }
+    try:
+        v_tag = JSONParser.parse_virtual_tag("TestVirtualTag", tag_info, conn_obj)
+        result = [tag.id for tag in v_tag.tags]
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, elevation",
+    [
+        ("../data/wrrf_sample.json", None),
+        ("../data/desal_sample.json", None),
+        ("../data/desal_sample.json", float("inf")),
+    ],
+)
+def test_from_stream(json_path, elevation):
+    pytest.importorskip("ijson")
+    if elevation is not None:
+        network = JSONParser(json_path).initialize_network()
+        network.nodes["DesalPlant"].elevation = elevation * u.m
+        JSONParser.to_json(network, "data/test_to_json.json")
+        json_path = "data/test_to_json.json"
+    parser = JSONParser.from_stream(json_path)
+    assert parser.config == JSONParser(json_path).config
+    result = parser.initialize_network()
+    expected = JSONParser(json_path).initialize_network()
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "tag_info, expected",
+    [
+        ({"type": "Flow", "contents": "NaturalGas"}, "NaturalGas"),
+        ({"type": "Flow"}, "Biogas"),
+        ({"type": "RunStatus"}, None),
+        ({"type": "Flow", "contents": "NotAContentsType"}, "ValueError"),
+    ],
+)
+def test_get_tag_contents(tag_info, expected):
+    network = JSONParser("../data/wrrf_sample.json").initialize_network()
+    conn_obj = network.get_connection("ConditionerToCogen", recurse=True)
+    try:
+        contents = JSONParser.get_tag_contents("TestTag", tag_info, conn_obj)
+        result = None if contents is None else contents.name
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "min_max_design, expected",
+    [
+        (None, (None, None, None)),
+        ({"min": 1, "max": 3, "design": 2}, (1, 3, 2)),
+        ({"min": 1, "max": 3, "avg": 2}, (1, 3, 2)),
+        (
+            {"min": None, "max": 3, "design": 2, "units": "m"},
+            (None, 3 * u.m, 2 * u.m),
+        ),
+    ],
+)
+def test_parse_min_max_design(min_max_design, expected):
+    result = JSONParser.parse_min_max_design(min_max_design)
+    assert result == expected
+    assert result.design == expected[2]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, node_id, expected",
+    [
+        ("../data/wrrf_sample.json", "Cogenerator", "Cogeneration"),
+        ("../data/wrrf_sample.json", None, "TypeError"),
+    ],
+)
+def test_node_to_dict(json_path, node_id, expected):
+    network = JSONParser(json_path).initialize_network()
+    node_obj = network.get_node(node_id, recurse=True) if node_id else network.tags
+    try:
+        result = JSONParser.node_to_dict(node_obj)["type"]
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "heating_vals",
+    [
+        None,
+        {"lower": 600, "higher": 700, "units": "BTU/scf"},
+        {"lower": None, "higher": 5, "units": "kWh/m3"},
+    ],
+)
+def test_heating_values_to_dict(heating_vals):
+    heating_values = JSONParser.parse_heating_values(heating_vals)
+    result = JSONParser.heating_values_to_dict(heating_values)
+    if heating_vals is None:
+        assert result == {"lower": None, "higher": None, "units": "BTU/scf"}
+    else:
+        # compare parsed units, since the formatted string depends on the pint version
+        assert result["lower"] == heating_vals["lower"]
+        assert result["higher"] == heating_vals["higher"]
+        assert utils.parse_units(result["units"]) == utils.parse_units(
+            heating_vals["units"]
+        )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b'{"nodes": ["A"], "value": 1.5}', {"nodes": ["A"], "value": 1.5}),
+        ('{"value": null}', {"value": None}),
+        (b'{"value": Infinity}', {"value": float("inf")}),
+        (b'{"value": ', "JSONDecodeError"),
+        (memoryview(b'{"value": Infinity}'), {"value": float("inf")}),
+    ],
+)
+def test_loads(data, expected):
+    try:
+        result = JSONParser.loads(data)
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, missing_node, missing_connection, expected",
+    [
+        ("../data/wrrf_sample.json", None, None, "Network"),
+        ("../data/wrrf_sample.json", "MissingNode", None, "NameError"),
+        ("../data/wrrf_sample.json", None, "MissingConnection", "NameError"),
+    ],
+)
+def test_missing_ids(json_path, missing_node, missing_connection, expected):
+    parser = JSONParser(json_path)
+    if missing_node:
+        parser.config["nodes"].append(missing_node)
+    if missing_connection:
+        parser.config["connections"].append(missing_connection)
+    try:
+        result = type(parser.initialize_network()).__name__
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path",
+    [
+        ("../data/wrrf_sample.json"),
+        ("../data/desal_sample.json"),
+        ("data/sample_nested_vtag.json"),
+    ],
+)
+def test_tag_index(json_path):
+    network = JSONParser(json_path).initialize_network()
+    result = JSONParser._tag_index(network)
+    assert result.keys() == {tag.id for tag in network.get_all_tags(recurse=True)}
+    for tag_id, tag_obj in result.items():
+        assert tag_obj is network.get_tag(tag_id, recurse=True)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path", [("../data/wrrf_sample.json"), ("data/sample_nested_vtag.json")]
+)
+def test_mmap_config(json_path, monkeypatch):
+    pytest.importorskip("orjson")
+    expected = JSONParser(json_path).config
+    # force the memory-mapped path regardless of file size
+    monkeypatch.setattr("pype_schema.parse_json._MMAP_THRESHOLD", 0)
+    result = JSONParser(json_path).config
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "tag_info, expected",
+    [
+        ({"type": "Flow", "units": "SCFM"}, None),
+        ({"type": "Flow", "units": "SCFM", "downsample_method": "Average"}, "Average"),
+        ({"type": "Flow", "units": "SCFM", "downsample_method": "Median"}, None),
+        ({"type": "NotATagType", "units": "SCFM"}, "KeyError"),
+    ],
+)
+def test_parse_tag(tag_info, expected):
+    network = JSONParser("../data/wrrf_sample.json").initialize_network()
+    conn_obj = network.get_connection("ConditionerToCogen", recurse=True)
+    try:
+        downsample_method = JSONParser.parse_tag(
+            "TestTag", tag_info, conn_obj
+        ).downsample_method
+        result = None if downsample_method is None else downsample_method.name
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "node_id, tag_info, expected",
+    [
+        ("Flare", {"type": "Flow", "contents": "Biogas"}, "Biogas"),
+        ("Flare", {"type": "Flow"}, "ValueError"),
+        ("Flare", {"type": "RunStatus"}, None),
+    ],
+)
+def test_get_tag_contents_node(node_id, tag_info, expected):
+    network = JSONParser("../data/wrrf_sample.json").initialize_network()
+    node_obj = network.get_node(node_id, recurse=True)
+    try:
+        contents = JSONParser.get_tag_contents("TestTag", tag_info, node_obj)
+        result = None if contents is None else contents.name
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
@@ -1,10 +1,11 @@
 import os
 import pint
+import pickle
 import pytest
 import numpy as np
 import pandas as pd
 from pype_schema.units import u
-from pype_schema.tag import Tag, TagType
+from pype_schema.tag import Tag, TagType, compile_operations
 from pype_schema.utils import parse_units, ContentsType
 from pype_schema.parse_json import JSONParser
 
@@ -418,3 +419,64 @@ def test_v_tag_less_than(json_path, tag_0_id, tag_1_id, expected):
     tag_0 = network.get_tag(tag_0_id, recurse=True)
     tag_1 = network.get_tag(tag_1_id, recurse=True)
     assert expected == (tag_0 < tag_1)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "pkl_path",
+    [("data/all_tags.pkl"), ("data/all_tags_virtual.pkl")],
+)
+def test_pickle_slots(pkl_path):
+    # pickles written before Tag and VirtualTag used __slots__ must still load
+    with open(pkl_path, "rb") as pickle_file:
+        tags = pickle.load(pickle_file)
+
+    for tag in tags:
+        assert not hasattr(tag, "__dict__")
+        assert pickle.loads(pickle.dumps(tag)) == tag
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_default_calibration_not_shared():
+    tag1 = Tag("Tag1", None, TagType.Flow, "total", None, "Node1")
+    tag2 = Tag("Tag2", None, TagType.Flow, "total", None, "Node1")
+    assert tag1.calibration == tag2.calibration
+    assert tag1.calibration is not tag2.calibration
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "operations, args, expected",
+    [
+        ("lambda tag1,tag2: tag1+tag2", (1, 2), 3),
+        ("lambda x: np.abs(x)", (-2,), 2),
+        ("lambda x: ", (1,), "SyntaxError"),
+    ],
+)
+def test_compile_operations(operations, args, expected):
+    try:
+        func = compile_operations(operations)
+        assert func is compile_operations(operations)
+        result = func(*args)
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "json_path, csv_path, tag_name",
+    [
+        (
+            "../data/wrrf_sample.json",
+            "data/sample_data.csv",
+            "ElectricityProductionByGasVolume",
+        ),
+    ],
+)
+def test_calculate_values_keeps_data(json_path, csv_path, tag_name):
+    tag = JSONParser(json_path).initialize_network().get_tag(tag_name, recurse=True)
+    data = pd.read_csv(csv_path)
+    columns = list(data.columns)
+    tag.calculate_values(data)
+    assert list(data.columns) == columns
@@ -49,3 +49,56 @@ def test_parse_units(units, expected):
     except Exception as err:
         result = type(err).__name__
         assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "efficiency, arg, expected",
+    [
+        (0.8, None, 0.8),
+        ("0.5", 10, 0.5),
+        ({1: 0.6, 2: 0.7}, 2, 0.7),
+        ({1: 0.6, 2: 0.7}, 3, "KeyError"),
+        ("high", 1, "ValueError"),
+    ],
+)
+def test_efficiency_curve(efficiency, arg, expected):
+    try:
+        result = ut.efficiency_curve(efficiency)(arg)
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "units, expected",
+    [
+        (u.m, "meter"),
+        (u.s * u.m, "meter * second"),
+        (u.gal / u.day, "gallon / day"),
+        (None, "None"),
+    ],
+)
+def test_units_to_str(units, expected):
+    assert ut.units_to_str(units) == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "func_str, expected",
+    [
+        ("lambda tag1: tag1", 1),
+        ("lambda tag1,tag2,tag3: tag1+tag2+tag3", 3),
+        ("lambda a, b=1: a + b", 1),
+        ("lambda a, *, b: a + b", 2),
+        ("lambda a:", "SyntaxError"),
+    ],
+)
+def test_count_args(func_str, expected):
+    try:
+        result = ut.count_args(func_str)
+        assert ut.count_args(func_str) == result
+    except Exception as err:
+        result = type(err).__name__
+    assert result == expected
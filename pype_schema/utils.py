@@ -1,10 +1,19 @@
 from enum import Enum, auto
+from collections import namedtuple
+from functools import lru_cache, partial
 from pint import UndefinedUnitError
 from .units import u
 
+# named (but still tuple-compatible) minimum/maximum/design and heating value ranges
+MinMaxDesign = namedtuple("MinMaxDesign", ["min", "max", "design"])
+HeatingValues = namedtuple("HeatingValues", ["lower", "higher"])
 
+
+@lru_cache(maxsize=None)
 def count_args(func_str):
-    """Count the arguments for a lambda function string
+    """Count the arguments for a lambda function string.
+    Results are cached since the same operations string is checked
+    every time a virtual tag is created or evaluated
 
     Parameters
     ----------
@@ -49,6 +58,32 @@ def get_tag_sum_lambda_func(unit_ids):
     return f"lambda {arguments}: {ops}"
 
 
+def _constant_efficiency(efficiency, arg):
+    return efficiency
+
+
+def efficiency_curve(efficiency):
+    """Create an efficiency curve that returns the efficiency
+    at a given operating point
+
+    Parameters
+    ----------
+    efficiency : dict or float
+        Either a dictionary mapping operating points to efficiencies
+        or a constant efficiency
+
+    Returns
+    -------
+    function
+        Callable returning the efficiency at a given operating point
+    """
+    # TODO: fix this so that it interpolates between dictionary values
+    if isinstance(efficiency, dict):
+        return efficiency.__getitem__
+    else:
+        return partial(_constant_efficiency, float(efficiency))
+
+
 def parse_quantity(value, units):
     """Convert a value and unit string to a Pint quantity
 
@@ -72,8 +107,28 @@ def parse_quantity(value, units):
         return None
 
 
+@lru_cache(maxsize=None)
+def units_to_str(units):
+    """Convert a Pint Unit object to its string representation.
+    Results are cached since Pint's unit formatting is slow
+    and the same units recur across a network
+
+    Parameters
+    ----------
+    units : Unit
+
+    Returns
+    -------
+    str
+        string representation of `units`
+    """
+    return str(units)
+
+
+@lru_cache(maxsize=None)
 def parse_units(units):
-    """Convert a unit string to a Pint Unit object
+    """Convert a unit string to a Pint Unit object.
+    Results are cached since the same unit strings recur across a configuration
 
     Parameters
     ----------
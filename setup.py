@@ -14,6 +14,12 @@ test_requirements = [
     "pytest-html>=3.1.1",
 ]
 
+# optional packages that speed up reading and writing JSON configurations
+fast_requirements = [
+    "orjson>=3.6.0",
+    "ijson>=3.1.0",
+]
+
 dev_requirements = [
     *setup_requirements,
     *test_requirements,
@@ -37,9 +43,11 @@ extra_requirements = {
     "setup": setup_requirements,
     "test": test_requirements,
     "dev": dev_requirements,
+    "fast": fast_requirements,
     "all": [
         *requirements,
         *dev_requirements,
+        *fast_requirements,
     ],
 }
 